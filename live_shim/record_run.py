@@ -177,32 +177,8 @@ def _apply_default_feedback_to_director(*, director: Any, decisions: list[dict])
             pass
 
 
-def run_payload(
-    payload: dict,
-    emit_outputs: bool = False,
-    *,
-    director_instance: Any = None,
-    env_instance: Env | None = None,
-) -> Path:
-    session_id = payload["session_id"]
-    inputs = payload["inputs"]
-    fixture_hint = payload.get("fixture_hint")
-
-    selected_active_director = _selected_director(payload)
-    if director_instance is None:
-        director = (
-            ProviderDirector()
-            if selected_active_director == "ProviderDirector"
-            else OfflineDirector()
-        )
-        active_director = selected_active_director
-    else:
-        director = director_instance
-        active_director = _director_name_for_instance(director) or selected_active_director
-
-    env = env_instance if env_instance is not None else Env(offline=(not _is_live_payload(payload)))
-
-    decisions = []
+def build_decisions(inputs: list, *, session_id: str, director: Any, env: Env) -> list[dict]:
+    decisions: list[dict] = []
     for item in inputs:
         metadata = item.get("metadata", {})
         if not isinstance(metadata, dict):
@@ -226,6 +202,35 @@ def run_payload(
                 }
             )
         )
+    return decisions
+
+
+def build_run_doc(
+    payload: dict,
+    emit_outputs: bool = False,
+    *,
+    director_instance: Any = None,
+    env_instance: Env | None = None,
+) -> dict:
+    session_id = payload["session_id"]
+    inputs = payload["inputs"]
+    fixture_hint = payload.get("fixture_hint")
+
+    selected_active_director = _selected_director(payload)
+    if director_instance is None:
+        director = (
+            ProviderDirector()
+            if selected_active_director == "ProviderDirector"
+            else OfflineDirector()
+        )
+        active_director = selected_active_director
+    else:
+        director = director_instance
+        active_director = _director_name_for_instance(director) or selected_active_director
+
+    env = env_instance if env_instance is not None else Env(offline=(not _is_live_payload(payload)))
+
+    decisions = build_decisions(inputs, session_id=session_id, director=director, env=env)
 
     # Strip inner_circle from persisted inputs to avoid identity leakage (SEC-006).
     sanitized_inputs = copy.deepcopy(inputs)
@@ -274,6 +279,24 @@ def run_payload(
         _apply_default_feedback_to_director(director=director, decisions=decisions)
     if fixture_hint:
         output["fixture_hint"] = fixture_hint
+    return output
+
+
+def run_payload(
+    payload: dict,
+    emit_outputs: bool = False,
+    *,
+    director_instance: Any = None,
+    env_instance: Env | None = None,
+) -> Path:
+    output = build_run_doc(
+        payload,
+        emit_outputs,
+        director_instance=director_instance,
+        env_instance=env_instance,
+    )
+    session_id = payload["session_id"]
+    inputs = payload["inputs"]
 
     runs_dir = _runs_output_dir()
     runs_dir.mkdir(parents=True, exist_ok=True)
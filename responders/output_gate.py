@@ -147,6 +147,12 @@ def _disallowed_emote_in_text(text: str, allowed: List[str], *, message_text: st
     return None
 
 
+def reset_emit_state_for_tests() -> None:
+    global _LAST_EMIT_TS
+    _LAST_EMIT_TS = 0.0
+    _LAST_EMIT_BY_KEY.clear()
+
+
 def maybe_emit(decisions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     global _LAST_EMIT_TS, _LAST_EMIT_BY_KEY
 
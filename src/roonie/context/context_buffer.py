@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 import re
-from typing import Any, Callable, Deque, Dict, List, Literal, Optional
+import sys
+from typing import Any, Callable, Dict, Iterable, List, Literal, Optional
 
 Speaker = Literal["user", "roonie"]
 
@@ -19,7 +19,7 @@ _UTILITY_CATEGORIES = {
 }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ContextTurn:
     ts: str
     speaker: Speaker
@@ -35,12 +35,28 @@ class ContextBuffer:
 
     def __init__(self, *, max_turns: int = 12, now_fn: Optional[Callable[[], datetime]] = None) -> None:
         self._max_turns = max(1, int(max_turns))
-        self._turns: Deque[ContextTurn] = deque(maxlen=self._max_turns)
+        # Fixed-size ring: _head is the next write slot, _len the number of live turns.
+        self._ring: List[Optional[ContextTurn]] = [None] * self._max_turns
+        self._head = 0
+        self._len = 0
         self._now_fn = now_fn or (lambda: datetime.now(timezone.utc))
 
     def _now_iso(self) -> str:
         return self._now_fn().isoformat()
 
+    def _recent(self, count: int) -> List[ContextTurn]:
+        """The newest count turns (count <= _len), oldest first."""
+        size = self._max_turns
+        ring = self._ring
+        start = self._head - count
+        return [ring[(start + i) % size] for i in range(count)]  # type: ignore[misc]
+
+    def _store(self, turn: ContextTurn) -> None:
+        self._ring[self._head] = turn
+        self._head = (self._head + 1) % self._max_turns
+        if self._len < self._max_turns:
+            self._len += 1
+
     @staticmethod
     def _is_user_relevant(*, text: str, direct_address: bool, category: str, continuation: bool = False) -> bool:
         if direct_address:
@@ -91,7 +107,7 @@ class ContextBuffer:
                 return False
             if not related_to_stored_user:
                 return False
-            if not any(t.speaker == "user" for t in self._turns):
+            if not any(t is not None and t.speaker == "user" for t in self._ring):
                 return False
 
         stored_tags: Dict[str, Any] = {}
@@ -101,7 +117,8 @@ class ContextBuffer:
             stored_tags["continuation"] = True
         if category:
             stored_tags["category"] = category
-        user_tag = str(incoming.get("user", "")).strip().lower()
+        # Interned so continuation checks against the director's viewer key hit identity.
+        user_tag = sys.intern(str(incoming.get("user", "")).strip().casefold())
         if user_tag:
             stored_tags["user"] = user_tag
 
@@ -111,15 +128,45 @@ class ContextBuffer:
             text=text_norm,
             tags=stored_tags,
         )
-        self._turns.append(turn)
+        self._store(turn)
         return True
 
+    def add_turns(self, turns: Iterable[Dict[str, Any]]) -> List[bool]:
+        """
+        Applies add_turn to each mapping of add_turn keyword arguments, in order.
+        Returns the per-turn stored flags.
+        """
+        add = self.add_turn
+        return [add(**turn) for turn in turns]
+
+    def bulk_add(self, turns: Iterable[ContextTurn]) -> None:
+        """
+        Stores prebuilt turns in order, bypassing the relevance gates.
+        Tags must already be normalized the way add_turn stores them.
+        """
+        pending = list(turns)
+        # Only the newest max_turns can survive; skip writing the rest.
+        for turn in pending[-self._max_turns :]:
+            self._store(turn)
+
     def get_context(self, max_turns: int = 3) -> List[ContextTurn]:
-        count = max(0, min(int(max_turns), self._max_turns))
+        count = max(0, min(int(max_turns), self._len))
         if count == 0:
             return []
         # Chronological order (oldest first) so the LLM reads conversation naturally.
-        return list(self._turns)[-count:]
+        return self._recent(count)
+
+    def get_user_turns(self, user_key: str, max_turns: int = 12) -> List[ContextTurn]:
+        """
+        User turns tagged with this viewer among the most recent max_turns, oldest first.
+        """
+        key = str(user_key or "").strip().casefold()
+        count = max(0, min(int(max_turns), self._len))
+        if not key or count == 0:
+            return []
+        return [t for t in self._recent(count) if t.speaker == "user" and t.tags.get("user") == key]
 
     def clear(self) -> None:
-        self._turns.clear()
+        self._ring = [None] * self._max_turns
+        self._head = 0
+        self._len = 0
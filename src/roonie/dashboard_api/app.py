@@ -3095,8 +3095,15 @@ def create_server(
     port: int = 8787,
     runs_dir: Path | None = None,
     readiness_state: Dict[str, Any] | None = None,
+    data_dir: Path | None = None,
+    logs_dir: Path | None = None,
 ) -> ThreadingHTTPServer:
-    storage = DashboardStorage(runs_dir=runs_dir, readiness_state=readiness_state)
+    storage = DashboardStorage(
+        runs_dir=runs_dir,
+        readiness_state=readiness_state,
+        data_dir=data_dir,
+        logs_dir=logs_dir,
+    )
     handler_cls = build_handler(storage)
     server = ThreadingHTTPServer((host, port), handler_cls)
     setattr(server, "_roonie_storage", storage)
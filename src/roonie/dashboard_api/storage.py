@@ -136,9 +136,14 @@ def _normalize_event_reply_controls(raw: Any) -> Dict[str, bool]:
             controls[event_type] = _to_bool(raw.get(event_type), controls[event_type])
     return controls
 
+# Stored hashes do not record their iteration count, so this must stay fixed
+# for a given auth_users.json; tests lower it to keep hashing cheap.
+PBKDF2_ITERATIONS = 200_000
+
+
 def hash_password(password: str) -> str:
     salt = secrets.token_bytes(16)
-    dk = hashlib.pbkdf2_hmac("sha256", str(password).encode("utf-8"), salt, 200_000)
+    dk = hashlib.pbkdf2_hmac("sha256", str(password).encode("utf-8"), salt, PBKDF2_ITERATIONS)
     return base64.b64encode(salt + dk).decode("ascii")
 
 
@@ -151,7 +156,7 @@ def verify_password(password: str, stored: str) -> bool:
         return False
     salt = raw[:16]
     stored_key = raw[16:]
-    new_key = hashlib.pbkdf2_hmac("sha256", str(password).encode("utf-8"), salt, 200_000)
+    new_key = hashlib.pbkdf2_hmac("sha256", str(password).encode("utf-8"), salt, PBKDF2_ITERATIONS)
     return secrets.compare_digest(new_key, stored_key)
 
 
@@ -351,13 +356,24 @@ class DashboardStorage:
     _KILL_SWITCH_ENV_NAMES = ("ROONIE_KILL_SWITCH", "KILL_SWITCH", "ROONIE_KILL_SWITCH_ON")
     _DRY_RUN_ENV_NAMES = ("ROONIE_DRY_RUN", "ROONIE_READ_ONLY_MODE")
 
-    def __init__(self, runs_dir: Optional[Path] = None, readiness_state: Optional[Dict[str, Any]] = None) -> None:
+    def __init__(
+        self,
+        runs_dir: Optional[Path] = None,
+        readiness_state: Optional[Dict[str, Any]] = None,
+        *,
+        data_dir: Optional[Path] = None,
+        logs_dir: Optional[Path] = None,
+    ) -> None:
         root = _repo_root()
         self.runs_dir = runs_dir or (root / "runs")
-        logs_dir_env = (os.getenv("ROONIE_DASHBOARD_LOGS_DIR") or "").strip()
-        self.logs_dir = (Path(logs_dir_env) if logs_dir_env else (root / "logs")).resolve()
-        data_dir_env = (os.getenv("ROONIE_DASHBOARD_DATA_DIR") or "").strip()
-        self.data_dir = (Path(data_dir_env) if data_dir_env else (root / "data")).resolve()
+        if logs_dir is None:
+            logs_dir_env = (os.getenv("ROONIE_DASHBOARD_LOGS_DIR") or "").strip()
+            logs_dir = Path(logs_dir_env) if logs_dir_env else (root / "logs")
+        self.logs_dir = Path(logs_dir).resolve()
+        if data_dir is None:
+            data_dir_env = (os.getenv("ROONIE_DASHBOARD_DATA_DIR") or "").strip()
+            data_dir = Path(data_dir_env) if data_dir_env else (root / "data")
+        self.data_dir = Path(data_dir).resolve()
         self._lock = threading.Lock()
         self._queue: List[Dict[str, Any]] = []
         self._control_state_path = self.data_dir / "control_state.json"
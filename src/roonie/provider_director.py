@@ -3,11 +3,13 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from difflib import SequenceMatcher
 from datetime import datetime, timedelta, timezone, tzinfo
+from functools import lru_cache
 from pathlib import Path
 import json
 import os
 import re
-from typing import Any, Dict, List, Optional
+import sys
+from typing import Any, Dict, List, Optional, Tuple
 try:
     from zoneinfo import ZoneInfo
 except Exception:  # pragma: no cover - ZoneInfo may be unavailable in minimal runtimes.
@@ -55,6 +57,14 @@ _TRACK_QUESTION_CUE_RE = re.compile(r"\b(what|which|id)\b|[?]", re.IGNORECASE)
 _TRACK_TERM_RE = re.compile(r"\b(track|song|tune|playing)\b", re.IGNORECASE)
 _SKIP_RE = re.compile(r"^\[?skip\]?$", re.IGNORECASE)
 _MENTION_RE = re.compile(r"@([A-Za-z0-9_]{2,30})")
+_LEADING_MENTION_RE = re.compile(r"^@\w+\s*")
+_LEADING_MENTIONS_RE = re.compile(r"^(?:@[A-Za-z0-9_]{2,30}\s+)+")
+_QUESTION_OPENER_RE = re.compile(
+    r"^(how|what|why|when|where|which|who|can|could|do|does|did|is|are|will|would|should|tell|say|give)\b"
+)
+_NON_WORD_RUN_RE = re.compile(r"[^\w\s]+")
+_WHITESPACE_RUN_RE = re.compile(r"\s+")
+_NON_ALIAS_CHAR_RE = re.compile(r"[^a-z0-9_]+")
 _GREETING_TARGET_RE = re.compile(
     r"^\s*(?:hey|heya|hi|hello|yo|sup)\b[\s,!-]*(?:@)?([A-Za-z0-9_]{2,30})",
     re.IGNORECASE,
@@ -224,10 +234,55 @@ def _library_index_path() -> Path:
     return _repo_root() / "data" / "library" / "library_index.json"
 
 
+@lru_cache(maxsize=32)
+def _direct_address_patterns(aliases: Tuple[str, ...]) -> Tuple[re.Pattern[str], ...]:
+    alt = "|".join(re.escape(a) for a in aliases if a)
+    if not alt:
+        return ()
+    # Avoid possessive third-person references ("Roonie's laptop") being treated as direct.
+    name_token = rf"(?:{alt})(?!['’]s)\b"
+    return tuple(
+        re.compile(pattern)
+        for pattern in (
+            # Explicit @mention or bare-handle kickoff.
+            rf"@{name_token}",
+            rf"^\s*(?:hey|heya|hi|hello|yo|sup|what'?s up)?[\s,!-]*@?{name_token}",
+            # Vocative tail ("..., roonie!").
+            rf"(?:,\s*|\s+){name_token}[!?.\s]*$",
+            # Named direct question/request ("Roonie how's ...", "Roonie can you ...").
+            rf"\b{name_token}[\s,:-]{{0,8}}(?:how|what|why|when|where|can|could|do|did|are|will|wanna|should|please|pls)\b",
+            # Vocative comma + second-person pronoun ("anyway roonie, you ...", "sorry roonie, your ...").
+            rf"\b{name_token}\s*,\s*(?:you|your|u|ur)\b",
+        )
+    )
+
+
+@lru_cache(maxsize=256)
+def _named_target_patterns(name: str) -> Tuple[re.Pattern[str], ...]:
+    name_re = re.escape(name)
+    # Vocative-style targeting:
+    # - "art, ..."
+    # - "..., art?"
+    # - "art - ..."
+    # - "what do you think art?"
+    return tuple(
+        re.compile(pattern)
+        for pattern in (
+            rf"^\s*(?:hey|hi|hello|yo|sup)?[\s,!-]*{name_re}\b",
+            rf"\b{name_re}\b\s*[-:]",
+            rf"(?:,\s*|\s+){name_re}[!?.,\s]*$",
+            rf",\s*{name_re}\s*[!?]",
+            rf"\b{name_re}\b\s*\?",
+            rf"\bwhat do you think\s+{name_re}\b",
+            rf"\bhow are (?:things|you)\b.*\b{name_re}\b",
+        )
+    )
+
+
 def _normalize_text(value: str) -> str:
     text = str(value or "").lower().strip()
-    text = re.sub(r"[^\w\s]+", " ", text)
-    text = re.sub(r"\s+", " ", text)
+    text = _NON_WORD_RUN_RE.sub(" ", text)
+    text = _WHITESPACE_RUN_RE.sub(" ", text)
     return text.strip()
 
 
@@ -322,7 +377,7 @@ def _specificity_gate_mode() -> str:
 
 
 def _strip_leading_mentions(text: str) -> str:
-    return re.sub(r"^(?:@[A-Za-z0-9_]{2,30}\s+)+", "", str(text or "").strip())
+    return _LEADING_MENTIONS_RE.sub("", str(text or "").strip())
 
 
 def _specificity_overlap_tokens(*, user_message: str, candidate: str) -> list[str]:
@@ -376,7 +431,12 @@ def _looks_like_direct_answer_prompt(message: str) -> bool:
         return True
     if starts_with_direct_verb(lowered):
         return True
-    return bool(re.match(r"^(how|what|why|when|where|which|who|can|could|do|does|did|is|are|will|would|should|tell|say|give)\b", lowered))
+    return bool(_QUESTION_OPENER_RE.match(lowered))
+
+
+def _user_key(value: Any) -> str:
+    """Case-folded, interned viewer login; matches the ``user`` tag ContextBuffer stores."""
+    return sys.intern(str(value or "").strip().casefold())
 
 
 def _normalize_name_alias(value: str) -> str:
@@ -384,7 +444,7 @@ def _normalize_name_alias(value: str) -> str:
     if not token:
         return ""
     token = token.translate(_LEETSPEAK_ALIAS_TRANSLATION)
-    token = re.sub(r"[^a-z0-9_]+", "", token)
+    token = _NON_ALIAS_CHAR_RE.sub("", token)
     return token
 
 
@@ -541,6 +601,20 @@ class ProviderDirector:
     def __post_init__(self) -> None:
         self._persona_policy_text = _load_persona_policy_text()
 
+    def _start_session(self, session_id: str) -> None:
+        self.context_buffer.clear()
+        self._session_id = session_id
+        self._turn_counter = 0
+        self._topic_anchor = ""
+        self._topic_anchor_turn = 0
+        self._topic_anchor_kind = ""
+        self._pending_assistant_turns.clear()
+        self._continuation_streak.clear()
+
+    def reset(self) -> None:
+        """Drop all conversation state without reloading the persona policy."""
+        self._start_session("")
+
     def _queue_pending_assistant_turn(self, *, event_id: str, text: str, related_to_stored_user: bool) -> None:
         key = str(event_id or "").strip()
         value = str(text or "").strip()
@@ -687,32 +761,13 @@ class ProviderDirector:
         bot_nick = str(metadata.get("bot_nick") or os.getenv("TWITCH_BOT_NICK", "")).strip().lower().lstrip("@")
         if bot_nick:
             aliases.add(bot_nick)
-        alt = "|".join(re.escape(a) for a in sorted(aliases) if a)
-        if not alt:
-            return False
-        # Avoid possessive third-person references ("Roonie's laptop") being treated as direct.
-        name_token = rf"(?:{alt})(?!['’]s)\b"
-
-        # Explicit @mention or bare-handle kickoff.
-        if re.search(rf"@{name_token}", msg):
-            return True
-        if re.search(rf"^\s*(?:hey|heya|hi|hello|yo|sup|what'?s up)?[\s,!-]*@?{name_token}", msg):
-            return True
-        # Vocative tail ("..., roonie!").
-        if re.search(rf"(?:,\s*|\s+){name_token}[!?.\s]*$", msg):
-            return True
-        # Named direct question/request ("Roonie how's ...", "Roonie can you ...").
-        if re.search(rf"\b{name_token}[\s,:-]{{0,8}}(?:how|what|why|when|where|can|could|do|did|are|will|wanna|should|please|pls)\b", msg):
-            return True
-        # Vocative comma + second-person pronoun ("anyway roonie, you ...", "sorry roonie, your ...").
-        if re.search(rf"\b{name_token}\s*,\s*(?:you|your|u|ur)\b", msg):
-            return True
-        return False
+        patterns = _direct_address_patterns(tuple(sorted(aliases)))
+        return any(pattern.search(msg) for pattern in patterns)
 
     def _find_unanswered_track_id_asker(self, current_viewer: str) -> Optional[str]:
         """Scan context buffer for a recent TRACK_ID question from a different viewer
         that Roonie hasn't answered yet.  Returns the viewer name or None."""
-        current = str(current_viewer or "").strip().lower()
+        current = _user_key(current_viewer)
         turns = self.context_buffer.get_context(max_turns=8)
         # Walk backwards: find user turns with track_id category that have no
         # subsequent roonie turn (i.e. unanswered).
@@ -723,13 +778,13 @@ class ProviderDirector:
                 # Any user turn before this roonie turn is considered answered.
                 for j in range(i - 1, -1, -1):
                     if turns[j].speaker == "user":
-                        u = str(turns[j].tags.get("user", "")).strip().lower()
+                        u = turns[j].tags.get("user", "")
                         if u:
                             answered_viewers.add(u)
                         break
                 continue
             if t.speaker == "user":
-                asker = str(t.tags.get("user", "")).strip().lower()
+                asker = t.tags.get("user", "")
                 cat = str(t.tags.get("category", "")).strip().lower()
                 if (
                     cat == CATEGORY_TRACK_ID.lower()
@@ -740,10 +795,10 @@ class ProviderDirector:
                     return asker
         return None
 
-    def _is_conversation_continuation(self, event: Event) -> bool:
-        """True if Roonie's most recent response was to this same viewer
-        AND the conversation hasn't moved on (recency gate: ≤3 user messages since)."""
-        viewer = str((event.metadata or {}).get("user", "")).strip().lower()
+    def _is_conversation_continuation(self, viewer: str) -> bool:
+        """True if Roonie's most recent response was to this same viewer (a
+        ``_user_key``) AND the conversation hasn't moved on (recency gate:
+        ≤3 user messages since)."""
         if not viewer:
             return False
         turns = self.context_buffer.get_context(max_turns=8)
@@ -758,7 +813,7 @@ class ProviderDirector:
                     return False  # Conversation has moved on
                 for j in range(i - 1, -1, -1):
                     if turns[j].speaker == "user":
-                        return str(turns[j].tags.get("user", "")).strip().lower() == viewer
+                        return turns[j].tags.get("user", "") == viewer
                 break  # Found roonie turn but no preceding user turn
             else:
                 messages_since_roonie += 1
@@ -860,25 +915,7 @@ class ProviderDirector:
         if not names:
             return False
         for name in sorted(names):
-            name_re = re.escape(name)
-            # Vocative-style targeting:
-            # - "art, ..."
-            # - "..., art?"
-            # - "art - ..."
-            # - "what do you think art?"
-            if re.search(rf"^\s*(?:hey|hi|hello|yo|sup)?[\s,!-]*{name_re}\b", text):
-                return True
-            if re.search(rf"\b{name_re}\b\s*[-:]", text):
-                return True
-            if re.search(rf"(?:,\s*|\s+){name_re}[!?.,\s]*$", text):
-                return True
-            if re.search(rf",\s*{name_re}\s*[!?]", text):
-                return True
-            if re.search(rf"\b{name_re}\b\s*\?", text):
-                return True
-            if re.search(rf"\bwhat do you think\s+{name_re}\b", text):
-                return True
-            if re.search(rf"\bhow are (?:things|you)\b.*\b{name_re}\b", text):
+            if any(pattern.search(text) for pattern in _named_target_patterns(name)):
                 return True
         return False
 
@@ -907,7 +944,7 @@ class ProviderDirector:
         text = str(event.message or "")
         # Block continuation on trivial content (single emote, emoji, punctuation-only)
         text_stripped = _TWITCH_EMOTE_TOKEN_RE.sub('', text)
-        text_stripped = re.sub(r'[^\w\s]', '', text_stripped).strip()
+        text_stripped = _NON_WORD_RUN_RE.sub('', text_stripped).strip()
         if not text_stripped or len(text_stripped) < 2:
             return "LOW_CONTENT"
         if self._reply_parent_targets_other(metadata=metadata):
@@ -996,7 +1033,7 @@ class ProviderDirector:
         if "?" in text:
             return False
         # Strip leading mention before measuring substance.
-        stripped = re.sub(r"^@\w+\s*", "", text).strip()
+        stripped = _LEADING_MENTION_RE.sub("", text).strip()
         if not stripped:
             return False
         if len(stripped) > _SHORT_ACK_MAX_CHARS:
@@ -1483,7 +1520,7 @@ class ProviderDirector:
         if not text:
             return ""
         # Strip leading @mentions (viewer or roonie) to avoid anchoring on handles.
-        text = re.sub(r"^@\w+\s*", "", text).strip()
+        text = _LEADING_MENTION_RE.sub("", text).strip()
 
         # Prefer numeric-ish anchors (e.g., "Maze 28") because they are distinctive.
         m = _TOPIC_ANCHOR_RE.search(text)
@@ -1743,19 +1780,46 @@ class ProviderDirector:
         )
         return flatten_roonie_messages(messages)
 
+    @staticmethod
+    def _empty_user_noop(event: Event, *, session_id: str) -> DecisionRecord:
+        return DecisionRecord(
+            case_id=str(event.metadata.get("case_id", "live")),
+            event_id=event.event_id,
+            action="NOOP",
+            route="none",
+            response_text=None,
+            trace={
+                "director": {
+                    "type": "ProviderDirector",
+                    "addressed_to_roonie": False,
+                    "trigger": False,
+                    "conversation_continuation": False,
+                    "continuation_reason": "EMPTY_USER",
+                    "continuation_capped": False,
+                    "continuation_streak": 0,
+                },
+                "proposal": {
+                    "text": None,
+                    "message_text": event.message,
+                    "provider_used": None,
+                    "route_used": "none",
+                    "moderation_status": "not_applicable",
+                    "session_id": session_id or None,
+                },
+            },
+        )
+
     def evaluate(self, event: Event, env: Env) -> DecisionRecord:
         session_id = str(event.metadata.get("session_id", "")).strip()
         if session_id and session_id != self._session_id:
-            self.context_buffer.clear()
-            self._session_id = session_id
-            self._turn_counter = 0
-            self._topic_anchor = ""
-            self._topic_anchor_turn = 0
-            self._topic_anchor_kind = ""
-            self._pending_assistant_turns.clear()
-            self._continuation_streak.clear()
+            self._start_session(session_id)
 
         metadata = event.metadata if isinstance(event.metadata, dict) else {}
+        viewer_key = _user_key(metadata.get("user"))
+        if not viewer_key:
+            # Events with no viewer (malformed or system) never get a reply; skip
+            # addressing, context and memory work entirely.
+            return self._empty_user_noop(event, session_id=session_id)
         addressed = self._is_direct_address(event)
         category = classify_behavior_category(message=event.message, metadata=metadata)
         short_ack_preferred = self._should_short_ack_direct_address(
@@ -1769,7 +1833,7 @@ class ProviderDirector:
         continuation = False
         continuation_reason = "ADDRESSED"
         if not addressed:
-            if self._is_conversation_continuation(event):
+            if self._is_conversation_continuation(viewer_key):
                 block_reason = self._continuation_block_reason(event=event, category=category)
                 if block_reason:
                     continuation = False
@@ -1850,7 +1914,7 @@ class ProviderDirector:
                 "direct_address": addressed,
                 "continuation": continuation,
                 "category": str(event.metadata.get("category", "")).strip().lower(),
-                "user": str(event.metadata.get("user", "")).strip().lower(),
+                "user": viewer_key,
             },
         )
         memory_result = SafeInjectionResult(
@@ -1864,11 +1928,9 @@ class ProviderDirector:
         # question that went unanswered, redirect the response to that viewer.
         track_id_redirected_from: Optional[str] = None
         if continuation:
-            track_asker = self._find_unanswered_track_id_asker(
-                str((event.metadata or {}).get("user", "")).strip().lower()
-            )
+            track_asker = self._find_unanswered_track_id_asker(viewer_key)
             if track_asker:
-                track_id_redirected_from = str((event.metadata or {}).get("user", "")).strip().lower()
+                track_id_redirected_from = viewer_key
                 metadata = dict(metadata)
                 metadata["user"] = track_asker
                 category = CATEGORY_TRACK_ID
@@ -1876,7 +1938,6 @@ class ProviderDirector:
                 continuation_reason = "TRACK_ID_REDIRECT"
 
         # Safety cap: reset streak on direct address, block after 4 consecutive continuation replies
-        viewer_key = str((event.metadata or {}).get("user", "")).strip().lower()
         continuation_capped = False
         if addressed and viewer_key:
             self._continuation_streak.pop(viewer_key, None)
@@ -2223,7 +2284,3 @@ class ProviderDirector:
             context_active=context_active,
             context_turns_used=context_turns_used,
         )
-
-
-
-
@@ -15,7 +15,7 @@ TriggerType = Literal["direct_question", "direct_request", "safety_issue", "bant
 SafetyClassification = Literal["allowed", "refuse", "sensitive_no_followup", "unknown"]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Event:
     event_id: str
     message: str
@@ -23,7 +23,7 @@ class Event:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Env:
     offline: bool = True
     stream_state: str = "online"
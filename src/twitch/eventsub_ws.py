@@ -6,15 +6,31 @@ import threading
 import time
 import urllib.error
 import urllib.request
-from datetime import datetime, timezone
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 
 
 _EVENTSUB_WS_URL = "wss://eventsub.wss.twitch.tv/ws"
+# A session_welcome for a session we subscribed within this window (e.g. after
+# session_reconnect, which carries subscriptions over) skips the POSTs.
+_SUBSCRIPTION_REUSE_SECONDS = 300.0
+_SUBSCRIBED_SESSION_TTL_SECONDS = 3600.0
+
+
+# (whole_second, "%Y-%m-%dT%H:%M:%S") for the most recent call; bursts of
+# messages within one second reuse the formatted prefix.
+_ISO_SECOND_CACHE: Tuple[int, str] = (-1, "")
 
 
 def _utc_now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat()
+    global _ISO_SECOND_CACHE
+    now = time.time()
+    whole = int(now)
+    cached_second, prefix = _ISO_SECOND_CACHE
+    if cached_second != whole:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(whole))
+        _ISO_SECOND_CACHE = (whole, prefix)
+    micros = int((now - whole) * 1_000_000)
+    return f"{prefix}.{micros:06d}+00:00"
 
 
 def normalize_eventsub_notification(message: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -163,6 +179,7 @@ class EventSubWSClient:
 
         self._stop = threading.Event()
         self._seen_event_ids: Dict[str, float] = {}
+        self._subscribed_sessions: Dict[str, float] = {}
         self._state: Dict[str, Any] = {
             "eventsub_connected": False,
             "eventsub_session_id": None,
@@ -265,6 +282,17 @@ class EventSubWSClient:
             _ = response.read()
 
     def _ensure_subscriptions(self, session_id: str) -> None:
+        now = self._time_fn()
+        stale = [
+            key for key, ts in self._subscribed_sessions.items()
+            if (now - ts) > _SUBSCRIBED_SESSION_TTL_SECONDS
+        ]
+        for key in stale:
+            self._subscribed_sessions.pop(key, None)
+        last = self._subscribed_sessions.get(session_id)
+        if last is not None and (now - last) < _SUBSCRIPTION_REUSE_SECONDS:
+            return
+        self._subscribed_sessions[session_id] = now
         specs = [
             ("channel.follow", "2", {"broadcaster_user_id": self._broadcaster_user_id, "moderator_user_id": self._broadcaster_user_id}),
             ("channel.subscribe", "1", {"broadcaster_user_id": self._broadcaster_user_id}),
@@ -90,8 +90,8 @@ def iter_twitch_messages(
             send(f"PONG {payload}")
             continue
 
-        notice = NOTICE_RE.match(line)
-        if notice:
+        # Cheap substring guards keep each regex off lines it can never match.
+        if " NOTICE " in line and (notice := NOTICE_RE.match(line)):
             msg = str(notice.group("msg") or "").strip()
             lowered = msg.lower()
             if (
@@ -106,11 +106,10 @@ def iter_twitch_messages(
             continue
 
         # Twitch can request the client reconnect.
-        if RECONNECT_RE.match(line):
+        if " RECONNECT" in line and RECONNECT_RE.match(line):
             raise RuntimeError("Twitch IRC requested reconnect")
 
-        m = PRIVMSG_RE.match(line)
-        if m:
+        if " PRIVMSG #" in line and (m := PRIVMSG_RE.match(line)):
             parsed_tags: dict = {}
             tag_str = m.group("tags") or ""
             if tag_str:
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import json
 import os
+import shutil
 import sys
 import tempfile
 from pathlib import Path
@@ -8,12 +10,19 @@ from pathlib import Path
 import pytest
 from _pytest.tmpdir import TempPathFactory
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional test speedup
+    orjson = None
+
 ROOT = str(Path(__file__).resolve().parents[1])
 if ROOT not in sys.path:
     sys.path.insert(0, ROOT)
 
 # Sandbox-safe temp root for pytest fixtures (tmp_path/tmpdir).
-_TMP_ROOT = Path(ROOT) / ".tmp_pytest"
+# ROONIE_PYTEST_TMP_ROOT may point this at a tmpfs (e.g. /dev/shm/roonie-pytest)
+# to keep the many small run-doc writes off disk.
+_TMP_ROOT = Path(os.environ.get("ROONIE_PYTEST_TMP_ROOT") or (Path(ROOT) / ".tmp_pytest"))
 _TMP_ROOT.mkdir(parents=True, exist_ok=True)
 os.environ["TMPDIR"] = str(_TMP_ROOT)
 os.environ["TEMP"] = str(_TMP_ROOT)
@@ -22,6 +31,30 @@ tempfile.tempdir = str(_TMP_ROOT)
 _SENSITIVE_TMP_FILENAMES = {"secrets.env"}
 
 
+def _json_dumps(obj) -> bytes:
+    """Serialize ``obj`` to UTF-8 JSON bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _json_loads(raw: bytes):
+    """Parse UTF-8 JSON bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _write_json(path: Path, obj) -> None:
+    """Write ``obj`` as UTF-8 JSON (orjson when installed)."""
+    path.write_bytes(_json_dumps(obj))
+
+
+def _read_json(path: Path):
+    """Parse a UTF-8 JSON file straight from bytes (orjson when installed)."""
+    return _json_loads(path.read_bytes())
+
+
 def _safe_getbasetemp(self: TempPathFactory) -> Path:
     if self._basetemp is not None:
         return self._basetemp
@@ -77,6 +110,12 @@ def pytest_sessionfinish(session, exitstatus) -> None:
     _cleanup_sensitive_tmp_files(_TMP_ROOT)
 
 
+@pytest.fixture
+def fast_pbkdf2(monkeypatch) -> None:
+    """Use a tiny pbkdf2 iteration count for one auth test (hash and verify agree)."""
+    monkeypatch.setattr("roonie.dashboard_api.storage.PBKDF2_ITERATIONS", 100)
+
+
 @pytest.fixture(autouse=True)
 def _reset_provider_failover_state():
     """Reset circuit breaker and stub cooldown state between tests to prevent bleed."""
@@ -90,6 +129,15 @@ def _reset_provider_failover_state():
     router._STUB_LAST_SENT = 0.0
 
 
+@pytest.fixture(autouse=True)
+def _reset_output_gate_state():
+    """Reset output gate emit cooldowns between tests so ordering cannot leak."""
+    from responders import output_gate
+    output_gate.reset_emit_state_for_tests()
+    yield
+    output_gate.reset_emit_state_for_tests()
+
+
 _ENV_VARS_TO_ISOLATE = [
     "ROONIE_ENFORCE_SETUP_GATE",
     "ROONIE_ARMED",
@@ -113,3 +161,63 @@ def _clean_leaked_env_vars():
             os.environ.pop(k, None)
         else:
             os.environ[k] = v
+
+
+# DashboardStorage syncs these into os.environ directly during __init__.
+_STORAGE_SYNCED_ENV_VARS = _ENV_VARS_TO_ISOLATE + [
+    "TWITCH_OUTPUT_ENABLED",
+    "ROONIE_ACTIVE_DIRECTOR",
+    "ROONIE_KILL_SWITCH",
+    "ROONIE_DRY_RUN",
+]
+
+
+def _set_dashboard_env(mp: pytest.MonkeyPatch, root: Path) -> None:
+    data_dir = root / "data"
+    mp.setenv("ROONIE_DASHBOARD_LOGS_DIR", str(root / "logs"))
+    mp.setenv("ROONIE_DASHBOARD_DATA_DIR", str(data_dir))
+    mp.setenv("ROONIE_PROVIDERS_CONFIG_PATH", str(data_dir / "providers_config.json"))
+    mp.setenv("ROONIE_ROUTING_CONFIG_PATH", str(data_dir / "routing_config.json"))
+
+
+def _bootstrap_dashboard_tree(root: Path, **extra_env: str) -> None:
+    """Construct a DashboardStorage over ``root`` without leaking its env side effects."""
+    from roonie.dashboard_api.storage import DashboardStorage
+
+    saved = {k: os.environ.get(k) for k in _STORAGE_SYNCED_ENV_VARS}
+    try:
+        with pytest.MonkeyPatch.context() as mp:
+            _set_dashboard_env(mp, root)
+            for name, value in extra_env.items():
+                mp.setenv(name, value)
+            DashboardStorage(runs_dir=root / "runs")
+    finally:
+        for k, v in saved.items():
+            if v is None:
+                os.environ.pop(k, None)
+            else:
+                os.environ[k] = v
+
+
+@pytest.fixture(scope="module")
+def storage_template(tmp_path_factory) -> Path:
+    """Bootstrap one DashboardStorage tree per module (seeded auth users, configs, memory db)."""
+    root = tmp_path_factory.mktemp("dashboard_template")
+    _bootstrap_dashboard_tree(root)
+    return root
+
+
+@pytest.fixture
+def dashboard_env(tmp_path: Path, monkeypatch) -> Path:
+    """Point the dashboard/provider config env vars at ``tmp_path``; returns the data dir."""
+    _set_dashboard_env(monkeypatch, tmp_path)
+    return tmp_path / "data"
+
+
+@pytest.fixture
+def storage(storage_template: Path, dashboard_env: Path, tmp_path: Path):
+    """Fresh DashboardStorage over a per-test copy of the module template."""
+    from roonie.dashboard_api.storage import DashboardStorage
+
+    shutil.copytree(storage_template, tmp_path, dirs_exist_ok=True)
+    return DashboardStorage(runs_dir=tmp_path / "runs")
@@ -1,13 +1,14 @@
 """Tests for AudioInputBridge event creation and pipeline delegation."""
 from __future__ import annotations
 
-import threading
 from pathlib import Path
 from typing import Any, Dict, Optional
-from unittest.mock import MagicMock, patch
 
 import pytest
 
+from conftest import _write_json
+from roonie.control_room.audio_bridge import AudioInputBridge, _load_audio_config
+
 
 # ── helpers ─────────────────────────────────────────────────
 
@@ -43,27 +44,33 @@ class _FakeStorage:
         self.data_dir = data_dir
 
 
+@pytest.fixture(scope="session")
+def readonly_data_dir(tmp_path_factory) -> Path:
+    """Empty data dir shared by bridge tests that never write config."""
+    return tmp_path_factory.mktemp("audio_bridge_ro")
+
+
+@pytest.fixture
+def bridge(readonly_data_dir):
+    return AudioInputBridge(
+        live_bridge=_FakeLiveBridge(),
+        storage=_FakeStorage(readonly_data_dir),
+    )
+
+
 # ── tests ───────────────────────────────────────────────────
 
 
-def test_emit_voice_event_delegates_to_live_bridge():
+def test_emit_voice_event_delegates_to_live_bridge(bridge):
     """_emit_voice_event should call LiveChatBridge._emit_payload_message with voice metadata."""
-    from roonie.control_room.audio_bridge import AudioInputBridge
-
-    fake_bridge = _FakeLiveBridge()
-    fake_storage = _FakeStorage(Path("data"))
-    bridge = AudioInputBridge(
-        live_bridge=fake_bridge,
-        storage=fake_storage,
-    )
     bridge._emit_voice_event(
         user="Art",
         message="what song is this",
         raw_text="hey roonie what song is this",
         confidence=1.0,
     )
-    assert len(fake_bridge.calls) == 1
-    call = fake_bridge.calls[0]
+    assert len(bridge._live_bridge.calls) == 1
+    call = bridge._live_bridge.calls[0]
     assert call["actor"] == "Art"
     assert call["message"] == "what song is this"
     assert call["channel"] == "voice"
@@ -75,20 +82,12 @@ def test_emit_voice_event_delegates_to_live_bridge():
     assert meta["voice_raw_text"] == "hey roonie what song is this"
 
 
-def test_emit_voice_event_handles_exception_gracefully():
+def test_emit_voice_event_handles_exception_gracefully(bridge, monkeypatch):
     """If _emit_payload_message raises, the bridge should log but not crash."""
-    from roonie.control_room.audio_bridge import AudioInputBridge
-
     def _exploding(**kwargs):
         raise RuntimeError("kaboom")
 
-    fake_bridge = MagicMock()
-    fake_bridge._emit_payload_message = _exploding
-    fake_storage = _FakeStorage(Path("data"))
-    bridge = AudioInputBridge(
-        live_bridge=fake_bridge,
-        storage=fake_storage,
-    )
+    monkeypatch.setattr(bridge._live_bridge, "_emit_payload_message", _exploding)
     # Should not raise.
     bridge._emit_voice_event(
         user="Art",
@@ -100,14 +99,9 @@ def test_emit_voice_event_handles_exception_gracefully():
 
 def test_bridge_stays_disabled_when_config_disabled(tmp_path):
     """When audio_config.json has enabled=false, _run should exit early."""
-    import json
-    from roonie.control_room.audio_bridge import AudioInputBridge
-
     data_dir = tmp_path / "data"
     data_dir.mkdir()
-    (data_dir / "audio_config.json").write_text(
-        json.dumps({"enabled": False}), encoding="utf-8",
-    )
+    _write_json(data_dir / "audio_config.json", {"enabled": False})
     fake_bridge = _FakeLiveBridge()
     fake_storage = _FakeStorage(data_dir)
     bridge = AudioInputBridge(
@@ -121,64 +115,44 @@ def test_bridge_stays_disabled_when_config_disabled(tmp_path):
 
 def test_load_audio_config_defaults(tmp_path):
     """_load_audio_config should return sane defaults for a missing file."""
-    from roonie.control_room.audio_bridge import _load_audio_config
-
+    expected = {
+        "enabled": False,
+        "sample_rate": 16_000,
+        "whisper_model": "base.en",
+        "wake_word_enabled": True,
+        "voice_default_user": "Art",
+    }
     config = _load_audio_config(tmp_path)
-    assert config["enabled"] is False
-    assert config["sample_rate"] == 16_000
-    assert config["whisper_model"] == "base.en"
-    assert config["wake_word_enabled"] is True
-    assert config["voice_default_user"] == "Art"
+    assert {k: config[k] for k in expected} == expected
 
 
 def test_load_audio_config_override(tmp_path):
     """_load_audio_config should pick up values from audio_config.json."""
-    import json
-
     cfg = {"enabled": True, "device_name": "Broadcast Stream Mix", "whisper_model": "small.en"}
-    (tmp_path / "audio_config.json").write_text(json.dumps(cfg), encoding="utf-8")
-    from roonie.control_room.audio_bridge import _load_audio_config
+    _write_json(tmp_path / "audio_config.json", cfg)
 
     config = _load_audio_config(tmp_path)
-    assert config["enabled"] is True
-    assert config["device_name"] == "Broadcast Stream Mix"
-    assert config["whisper_model"] == "small.en"
     # Defaults still present for missing keys.
-    assert config["sample_rate"] == 16_000
+    expected = {**cfg, "sample_rate": 16_000}
+    assert {k: config[k] for k in expected} == expected
 
 
-def test_voice_metadata_contains_required_fields():
+def test_voice_metadata_contains_required_fields(bridge):
     """Voice events must include platform, source, is_direct_mention, confidence, raw_text."""
-    from roonie.control_room.audio_bridge import AudioInputBridge
-
-    fake_bridge = _FakeLiveBridge()
-    fake_storage = _FakeStorage(Path("data"))
-    bridge = AudioInputBridge(
-        live_bridge=fake_bridge,
-        storage=fake_storage,
-    )
     bridge._emit_voice_event(
         user="Jen",
         message="play something chill",
         raw_text="hey roonie play something chill",
         confidence=0.85,
     )
-    meta = fake_bridge.calls[0]["metadata_extra"]
+    meta = bridge._live_bridge.calls[0]["metadata_extra"]
     required_keys = {"platform", "source", "is_direct_mention", "voice_confidence", "voice_raw_text"}
     assert required_keys.issubset(set(meta.keys()))
     assert meta["is_direct_mention"] is True
 
 
-def test_bridge_start_stop():
+def test_bridge_start_stop(bridge):
     """start() and stop() should not raise even without audio hardware."""
-    from roonie.control_room.audio_bridge import AudioInputBridge
-
-    fake_bridge = _FakeLiveBridge()
-    fake_storage = _FakeStorage(Path("data"))
-    bridge = AudioInputBridge(
-        live_bridge=fake_bridge,
-        storage=fake_storage,
-    )
     bridge.start()
     # Give thread a moment to start (it will exit quickly since config disabled).
     bridge.stop()
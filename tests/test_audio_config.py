@@ -1,53 +1,40 @@
 """Tests for audio config storage and senses policy integration."""
 from __future__ import annotations
 
-import json
-from pathlib import Path
-
 import pytest
 
-from roonie.dashboard_api.storage import DashboardStorage
-
-
-def _make_storage(tmp_path: Path, monkeypatch) -> DashboardStorage:
-    monkeypatch.setenv("ROONIE_DASHBOARD_LOGS_DIR", str(tmp_path / "logs"))
-    monkeypatch.setenv("ROONIE_DASHBOARD_DATA_DIR", str(tmp_path / "data"))
-    monkeypatch.setenv("ROONIE_PROVIDERS_CONFIG_PATH", str(tmp_path / "data" / "providers_config.json"))
-    monkeypatch.setenv("ROONIE_ROUTING_CONFIG_PATH", str(tmp_path / "data" / "routing_config.json"))
-    return DashboardStorage(runs_dir=tmp_path / "runs")
+from conftest import _read_json, _write_json
 
 
 # ── audio_config storage ────────────────────────────────────
 
 
-def test_get_audio_config_creates_default(tmp_path, monkeypatch):
-    storage = _make_storage(tmp_path, monkeypatch)
+def test_get_audio_config_creates_default(storage):
+    expected = {
+        "enabled": False,
+        "sample_rate": 16_000,
+        "whisper_model": "base.en",
+        "whisper_device": "cuda",
+        "wake_word_enabled": True,
+        "transcription_interval_seconds": 3.0,
+        "voice_default_user": "Art",
+    }
     config = storage.get_audio_config()
     assert isinstance(config, dict)
-    assert config["enabled"] is False
-    assert config["sample_rate"] == 16_000
-    assert config["whisper_model"] == "base.en"
-    assert config["whisper_device"] == "cuda"
-    assert config["wake_word_enabled"] is True
-    assert config["transcription_interval_seconds"] == 3.0
-    assert config["voice_default_user"] == "Art"
+    assert {k: config[k] for k in expected} == expected
 
 
-def test_get_audio_config_returns_deepcopy(tmp_path, monkeypatch):
-    storage = _make_storage(tmp_path, monkeypatch)
+def test_get_audio_config_returns_deepcopy(storage):
     a = storage.get_audio_config()
     b = storage.get_audio_config()
+    assert a is not b
     # Ignore updated_at since it's set on each read-write cycle.
-    a.pop("updated_at", None)
-    b.pop("updated_at", None)
-    assert a == b
+    assert {k: v for k, v in a.items() if k != "updated_at"} == {k: v for k, v in b.items() if k != "updated_at"}
     a["enabled"] = True
-    c = storage.get_audio_config()
-    assert c["enabled"] is False  # original unchanged
+    assert storage.get_audio_config()["enabled"] is False  # original unchanged
 
 
-def test_update_audio_config_put(tmp_path, monkeypatch):
-    storage = _make_storage(tmp_path, monkeypatch)
+def test_update_audio_config_put(storage):
     _ = storage.get_audio_config()
     new_cfg, audit = storage.update_audio_config(
         {"enabled": True, "device_name": "Broadcast Stream Mix"},
@@ -59,8 +46,7 @@ def test_update_audio_config_put(tmp_path, monkeypatch):
     assert "enabled" in audit["changed_keys"]
 
 
-def test_update_audio_config_patch(tmp_path, monkeypatch):
-    storage = _make_storage(tmp_path, monkeypatch)
+def test_update_audio_config_patch(storage):
     _ = storage.get_audio_config()
     new_cfg, audit = storage.update_audio_config(
         {"whisper_model": "small.en"},
@@ -73,33 +59,24 @@ def test_update_audio_config_patch(tmp_path, monkeypatch):
     assert new_cfg["enabled"] is False
 
 
-def test_update_audio_config_invalid_sample_rate(tmp_path, monkeypatch):
-    storage = _make_storage(tmp_path, monkeypatch)
-    new_cfg, _ = storage.update_audio_config(
-        {"sample_rate": 99999},
-        actor="Art",
-        patch=True,
-    )
-    assert new_cfg["sample_rate"] == 16_000  # reset to default
-
-
-def test_update_audio_config_interval_clamped(tmp_path, monkeypatch):
-    storage = _make_storage(tmp_path, monkeypatch)
-    new_cfg, _ = storage.update_audio_config(
-        {"transcription_interval_seconds": 0.1},
-        actor="Art",
-        patch=True,
-    )
-    assert new_cfg["transcription_interval_seconds"] == 3.0  # reset to default (below 1.0)
+@pytest.mark.parametrize(
+    "field,bad,default",
+    [
+        ("sample_rate", 99999, 16_000),
+        ("transcription_interval_seconds", 0.1, 3.0),  # below 1.0
+    ],
+)
+def test_update_audio_config_invalid_value_resets_to_default(storage, field, bad, default):
+    new_cfg, _ = storage.update_audio_config({field: bad}, actor="Art", patch=True)
+    assert new_cfg[field] == default
 
 
-def test_audio_config_persisted_to_disk(tmp_path, monkeypatch):
-    storage = _make_storage(tmp_path, monkeypatch)
+def test_audio_config_persisted_to_disk(storage):
     storage.update_audio_config(
         {"enabled": True, "device_name": "Test Device"},
         actor="Art",
     )
-    raw = json.loads((tmp_path / "data" / "audio_config.json").read_text(encoding="utf-8"))
+    raw = _read_json(storage.data_dir / "audio_config.json")
     assert raw["enabled"] is True
     assert raw["device_name"] == "Test Device"
 
@@ -107,19 +84,18 @@ def test_audio_config_persisted_to_disk(tmp_path, monkeypatch):
 # ── senses integration ──────────────────────────────────────
 
 
-def test_senses_status_honors_enabled_field(tmp_path, monkeypatch):
+def test_senses_status_honors_enabled_field(storage):
     """Senses should no longer be hard-disabled — it should respect the config."""
-    storage = _make_storage(tmp_path, monkeypatch)
     status = storage.get_senses_status()
     # Default: enabled=False → live_hard_disabled=True.
     assert status["enabled"] is False
     assert status["live_hard_disabled"] is True
 
     # Write enabled=True to the senses config and verify.
-    senses_path = tmp_path / "data" / "senses_config.json"
-    cfg = json.loads(senses_path.read_text(encoding="utf-8"))
+    senses_path = storage.data_dir / "senses_config.json"
+    cfg = _read_json(senses_path)
     cfg["enabled"] = True
-    senses_path.write_text(json.dumps(cfg), encoding="utf-8")
+    _write_json(senses_path, cfg)
 
     status2 = storage.get_senses_status()
     assert status2["enabled"] is True
@@ -127,9 +103,8 @@ def test_senses_status_honors_enabled_field(tmp_path, monkeypatch):
     assert status2["reason"] == ""
 
 
-def test_senses_defaults_still_safe(tmp_path, monkeypatch):
+def test_senses_defaults_still_safe(storage):
     """Senses defaults should still be restrictive (never_initiate, no_viewer_recognition, etc.)."""
-    storage = _make_storage(tmp_path, monkeypatch)
     status = storage.get_senses_status()
     assert status["local_only"] is True
     assert status["never_initiate"] is True
@@ -1,20 +1,61 @@
 from __future__ import annotations
 
 import base64
-import json
+import shutil
 from pathlib import Path
+from typing import Tuple
 
-from roonie.dashboard_api.app import create_server
+import pytest
+
+import conftest
 from roonie.dashboard_api.storage import DashboardStorage, hash_password, verify_password
 
 
-def _set_dashboard_paths(monkeypatch, tmp_path: Path) -> Path:
-    data_dir = tmp_path / "data"
-    monkeypatch.setenv("ROONIE_DASHBOARD_LOGS_DIR", str(tmp_path / "logs"))
-    monkeypatch.setenv("ROONIE_DASHBOARD_DATA_DIR", str(data_dir))
-    monkeypatch.setenv("ROONIE_PROVIDERS_CONFIG_PATH", str(data_dir / "providers_config.json"))
-    monkeypatch.setenv("ROONIE_ROUTING_CONFIG_PATH", str(data_dir / "routing_config.json"))
-    return data_dir
+_SEED_ART_PASSWORD = "roonie"
+_SEED_JEN_PASSWORD = "jen-pass-123"
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _fast_pbkdf2():
+    """Use a tiny pbkdf2 iteration count for this module (hash and verify agree)."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("roonie.dashboard_api.storage.PBKDF2_ITERATIONS", 100)
+        yield
+
+
+@pytest.fixture(scope="module")
+def seeded_auth_dir(tmp_path_factory, _fast_pbkdf2) -> Path:
+    """Seed auth_users.json (pbkdf2-hashed) once; tests get a copy via ``data_dir``."""
+    root = tmp_path_factory.mktemp("auth_seed")
+    conftest._bootstrap_dashboard_tree(
+        root,
+        ROONIE_DASHBOARD_ART_PASSWORD=_SEED_ART_PASSWORD,
+        ROONIE_DASHBOARD_JEN_PASSWORD=_SEED_JEN_PASSWORD,
+    )
+    return root / "data"
+
+
+@pytest.fixture(scope="session")
+def auth_template_dir(tmp_path_factory) -> Path:
+    """Empty data/ + runs/ layout created once and copied into each test."""
+    root = tmp_path_factory.mktemp("auth_template")
+    (root / "data").mkdir()
+    (root / "runs").mkdir()
+    return root
+
+
+@pytest.fixture
+def auth_paths(auth_template_dir: Path, dashboard_env: Path, tmp_path: Path) -> Tuple[Path, Path]:
+    """(data_dir, runs_dir) under tmp_path, with the dashboard env pointed at them."""
+    shutil.copytree(auth_template_dir, tmp_path, dirs_exist_ok=True)
+    return dashboard_env, tmp_path / "runs"
+
+
+@pytest.fixture
+def data_dir(seeded_auth_dir: Path, auth_paths: Tuple[Path, Path]) -> Path:
+    data, _runs = auth_paths
+    shutil.copytree(seeded_auth_dir, data, dirs_exist_ok=True)
+    return data
 
 
 def test_password_hash_verify_roundtrip() -> None:
@@ -38,10 +79,10 @@ def test_password_hash_binary_layout_is_salt_plus_key() -> None:
     assert len(raw) == 48
 
 
-def test_legacy_auth_users_format_reseeds_automatically(tmp_path: Path, monkeypatch) -> None:
-    runs_dir = tmp_path / "runs"
-    runs_dir.mkdir(parents=True, exist_ok=True)
-    data_dir = _set_dashboard_paths(monkeypatch, tmp_path)
+def test_legacy_auth_users_format_reseeds_automatically(monkeypatch, auth_paths: Tuple[Path, Path]) -> None:
+    from roonie.dashboard_api.app import create_server
+
+    data_dir, runs_dir = auth_paths
     monkeypatch.setenv("ROONIE_DASHBOARD_ART_PASSWORD", "art-pass-123")
     monkeypatch.setenv("ROONIE_DASHBOARD_JEN_PASSWORD", "jen-pass-123")
 
@@ -60,14 +101,13 @@ def test_legacy_auth_users_format_reseeds_automatically(tmp_path: Path, monkeypa
             },
         ],
     }
-    data_dir.mkdir(parents=True, exist_ok=True)
     auth_path = data_dir / "auth_users.json"
-    auth_path.write_text(json.dumps(legacy_payload), encoding="utf-8")
+    conftest._write_json(auth_path, legacy_payload)
 
     server = create_server(host="127.0.0.1", port=0, runs_dir=runs_dir)
     try:
         storage = getattr(server, "_roonie_storage")
-        payload = json.loads(auth_path.read_text(encoding="utf-8"))
+        payload = conftest._read_json(auth_path)
         users = payload.get("users", [])
         assert isinstance(users, list)
         assert all("$" not in str(item.get("password_hash", "")) for item in users if isinstance(item, dict))
@@ -78,66 +118,52 @@ def test_legacy_auth_users_format_reseeds_automatically(tmp_path: Path, monkeypa
         server.server_close()
 
 
-def test_login_uses_resolved_storage_data_dir(tmp_path: Path, monkeypatch) -> None:
+def test_login_uses_resolved_storage_data_dir(tmp_path: Path, monkeypatch, data_dir: Path) -> None:
     runs_dir = tmp_path / "runs"
-    runs_dir.mkdir(parents=True, exist_ok=True)
-    data_dir = _set_dashboard_paths(monkeypatch, tmp_path)
-    monkeypatch.setenv("ROONIE_DASHBOARD_ART_PASSWORD", "roonie")
-    monkeypatch.setenv("ROONIE_DASHBOARD_JEN_PASSWORD", "jen-pass-123")
 
     # Guard against accidentally preferring a different runtime location.
     localapp = tmp_path / "localapp"
     monkeypatch.setenv("LOCALAPPDATA", str(localapp))
     wrong_auth_path = localapp / "RoonieControlRoom" / "data" / "auth_users.json"
     wrong_auth_path.parent.mkdir(parents=True, exist_ok=True)
-    wrong_auth_path.write_text(
-        json.dumps(
-            {
-                "version": 1,
-                "users": [
-                    {"username": "art", "role": "director", "password_hash": "invalid"},
-                    {"username": "jen", "role": "operator", "password_hash": "invalid"},
-                ],
-            }
-        ),
-        encoding="utf-8",
+    conftest._write_json(
+        wrong_auth_path,
+        {
+            "version": 1,
+            "users": [
+                {"username": "art", "role": "director", "password_hash": "invalid"},
+                {"username": "jen", "role": "operator", "password_hash": "invalid"},
+            ],
+        },
     )
 
     storage = DashboardStorage(runs_dir=runs_dir)
     expected_auth_path = (data_dir / "auth_users.json").resolve()
     assert storage.auth_users_path == expected_auth_path
     assert expected_auth_path.exists()
-    assert storage.login_dashboard_user("art", "roonie") is not None
-    assert storage.login_dashboard_user("jen", "jen-pass-123") is not None
+    assert storage.login_dashboard_user("art", _SEED_ART_PASSWORD) is not None
+    assert storage.login_dashboard_user("jen", _SEED_JEN_PASSWORD) is not None
     assert storage.login_dashboard_user("art", "wrong-pass") is None
 
 
-def test_validate_operator_key_accepts_valid_value(monkeypatch) -> None:
-    monkeypatch.setenv("ROONIE_OPERATOR_KEY", "op-key-123")
-    ok, msg = DashboardStorage.validate_operator_key("op-key-123")
-    assert ok is True
-    assert msg == "ok"
-
-
-def test_validate_operator_key_rejects_invalid_value(monkeypatch) -> None:
-    monkeypatch.setenv("ROONIE_OPERATOR_KEY", "op-key-123")
-    ok, msg = DashboardStorage.validate_operator_key("wrong-key")
-    assert ok is False
-    assert msg == "Forbidden: invalid X-ROONIE-OP-KEY."
-
-
-def test_validate_operator_key_rejects_empty_or_none(monkeypatch) -> None:
-    monkeypatch.setenv("ROONIE_OPERATOR_KEY", "op-key-123")
-    ok_empty, msg_empty = DashboardStorage.validate_operator_key("")
-    ok_none, msg_none = DashboardStorage.validate_operator_key(None)
-    assert ok_empty is False
-    assert ok_none is False
-    assert msg_empty == "Forbidden: invalid X-ROONIE-OP-KEY."
-    assert msg_none == "Forbidden: invalid X-ROONIE-OP-KEY."
-
-
-def test_validate_operator_key_read_only_when_unset(monkeypatch) -> None:
-    monkeypatch.delenv("ROONIE_OPERATOR_KEY", raising=False)
-    ok, msg = DashboardStorage.validate_operator_key("anything")
-    assert ok is False
-    assert msg == "API is READ-ONLY: set ROONIE_OPERATOR_KEY to enable write actions."
+_FORBIDDEN = "Forbidden: invalid X-ROONIE-OP-KEY."
+_READ_ONLY = "API is READ-ONLY: set ROONIE_OPERATOR_KEY to enable write actions."
+
+
+@pytest.mark.parametrize(
+    "env,arg,ok,msg",
+    [
+        ("op-key-123", "op-key-123", True, "ok"),
+        ("op-key-123", "wrong-key", False, _FORBIDDEN),
+        ("op-key-123", "", False, _FORBIDDEN),
+        ("op-key-123", None, False, _FORBIDDEN),
+        (None, "anything", False, _READ_ONLY),
+    ],
+    ids=["valid", "invalid", "empty", "none", "unset-read-only"],
+)
+def test_validate_operator_key(monkeypatch, env, arg, ok, msg) -> None:
+    if env is None:
+        monkeypatch.delenv("ROONIE_OPERATOR_KEY", raising=False)
+    else:
+        monkeypatch.setenv("ROONIE_OPERATOR_KEY", env)
+    assert DashboardStorage.validate_operator_key(arg) == (ok, msg)
@@ -7,6 +7,8 @@ existing guardrails remain intact.
 
 from __future__ import annotations
 
+import pytest
+
 from roonie.behavior_spec import (
     CATEGORY_BANTER,
     CATEGORY_GREETING,
@@ -14,6 +16,22 @@ from roonie.behavior_spec import (
 )
 from roonie.prompting import DEFAULT_STYLE
 
+_ANCHORS = (
+    "You are not a weapon pointed at other people.",
+    "not like a policy document",
+    "Your plushie life:",
+    "How you talk:",
+    "Reading the room:",
+    "Don't start every response the same way",
+)
+_POS = {anchor: DEFAULT_STYLE.index(anchor) for anchor in _ANCHORS}
+
+_GUARDRAILS = (
+    "You do not roast, mock, or make fun of anyone on request",
+    "You do not fabricate memories",
+    "Light, playful teasing between you and your humans",
+)
+
 
 # ---------------------------------------------------------------------------
 # Prompt text assertions (DEFAULT_STYLE)
@@ -23,21 +41,15 @@ from roonie.prompting import DEFAULT_STYLE
 class TestDeflectionCoaching:
     """Deflection coaching examples appear in 'Respect and boundaries'."""
 
-    def test_contains_example_fraggy(self):
-        assert "nah, I like fraggy" in DEFAULT_STYLE
-
-    def test_contains_policy_document_antipattern(self):
-        assert "policy document" in DEFAULT_STYLE
+    @pytest.mark.parametrize("needle", ["nah, I like fraggy", "policy document"])
+    def test_contains_coaching_text(self, needle):
+        assert needle in DEFAULT_STYLE
 
     def test_coaching_after_roast_rule(self):
-        roast_pos = DEFAULT_STYLE.index("You are not a weapon pointed at other people.")
-        coaching_pos = DEFAULT_STYLE.index("not like a policy document")
-        assert coaching_pos > roast_pos
+        assert _POS["not like a policy document"] > _POS["You are not a weapon pointed at other people."]
 
     def test_coaching_before_plushie_life(self):
-        coaching_pos = DEFAULT_STYLE.index("not like a policy document")
-        plushie_pos = DEFAULT_STYLE.index("Your plushie life:")
-        assert coaching_pos < plushie_pos
+        assert _POS["not like a policy document"] < _POS["Your plushie life:"]
 
 
 class TestOpenerVariety:
@@ -47,23 +59,19 @@ class TestOpenerVariety:
         assert "Don't start every response the same way" in DEFAULT_STYLE
 
     def test_variety_in_how_you_talk_section(self):
-        how_you_talk_pos = DEFAULT_STYLE.index("How you talk:")
-        reading_room_pos = DEFAULT_STYLE.index("Reading the room:")
-        variety_pos = DEFAULT_STYLE.index("Don't start every response the same way")
-        assert how_you_talk_pos < variety_pos < reading_room_pos
+        assert (
+            _POS["How you talk:"]
+            < _POS["Don't start every response the same way"]
+            < _POS["Reading the room:"]
+        )
 
 
 class TestExistingGuardrailsIntact:
     """Core guardrails remain after banter-tuning additions."""
 
-    def test_roast_refusal_present(self):
-        assert "You do not roast, mock, or make fun of anyone on request" in DEFAULT_STYLE
-
-    def test_fabrication_rule_present(self):
-        assert "You do not fabricate memories" in DEFAULT_STYLE
-
-    def test_teasing_scope_present(self):
-        assert "Light, playful teasing between you and your humans" in DEFAULT_STYLE
+    @pytest.mark.parametrize("guardrail", _GUARDRAILS)
+    def test_guardrail_present(self, guardrail):
+        assert guardrail in DEFAULT_STYLE
 
 
 # ---------------------------------------------------------------------------
@@ -71,41 +79,49 @@ class TestExistingGuardrailsIntact:
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="module")
+def greeting_text():
+    return behavior_guidance(
+        category=CATEGORY_GREETING,
+        approved_emotes=[],
+        now_playing_available=False,
+    )
+
+
 class TestBanterGuidance:
     """BANTER category includes smooth-redirect instruction."""
 
-    def _banter_guidance(self, **kwargs):
+    @pytest.fixture(scope="class")
+    def default_banter_text(self):
         return behavior_guidance(
             category=CATEGORY_BANTER,
             approved_emotes=["roonieLove"],
             now_playing_available=False,
-            **kwargs,
         )
 
-    def test_smooth_redirect_present(self):
-        text = self._banter_guidance()
-        assert "Never sound like you're reading a policy" in text
-
-    def test_chat_naturally_still_present(self):
-        text = self._banter_guidance()
-        assert "Chat naturally" in text
-
-    def test_teasing_scope_still_present(self):
-        text = self._banter_guidance()
-        assert "people you know well" in text
+    @pytest.mark.parametrize(
+        "needle",
+        [
+            "Never sound like you're reading a policy",  # smooth redirect
+            "Chat naturally",
+            "people you know well",  # teasing scope
+        ],
+    )
+    def test_banter_contains(self, needle, default_banter_text):
+        assert needle in default_banter_text
 
     def test_short_ack_still_works(self):
-        text = self._banter_guidance(short_ack_preferred=True)
+        text = behavior_guidance(
+            category=CATEGORY_BANTER,
+            approved_emotes=["roonieLove"],
+            now_playing_available=False,
+            short_ack_preferred=True,
+        )
         assert "one short acknowledgment sentence" in text
 
 
 class TestGreetingGuidanceUnchanged:
     """GREETING guidance should NOT include redirect instruction."""
 
-    def test_no_redirect_in_greeting(self):
-        text = behavior_guidance(
-            category=CATEGORY_GREETING,
-            approved_emotes=[],
-            now_playing_available=False,
-        )
-        assert "Never sound like you're reading a policy" not in text
+    def test_no_redirect_in_greeting(self, greeting_text):
+        assert "Never sound like you're reading a policy" not in greeting_text
@@ -1,30 +1,93 @@
 from __future__ import annotations
 
-import json
+import dataclasses
+import functools
+import os
 from pathlib import Path
-from typing import Any, Dict, List
+from types import SimpleNamespace
+from typing import Any, Dict, Final, List, Tuple
 
-from live_shim.record_run import run_payload
+import pytest
+
+import conftest
+import roonie.provider_director as _pd_mod
+from adapters.twitch_output import TwitchOutputAdapter as _TOA
+from live_shim.record_run import build_run_doc, run_payload
+from responders import output_gate
+from roonie.provider_director import ProviderDirector as _PD
 from roonie.types import DecisionRecord, Env, Event
 
+# output_gate keeps module-level emit state; keep this module on one xdist worker.
+pytestmark = pytest.mark.xdist_group("phase19_behavior")
 
-def _set_runtime_paths(monkeypatch, tmp_path: Path) -> None:
-    monkeypatch.setenv("ROONIE_DASHBOARD_RUNS_DIR", str(tmp_path / "runs"))
-    monkeypatch.setenv("ROONIE_DASHBOARD_DATA_DIR", str(tmp_path / "data"))
-    monkeypatch.setenv("ROONIE_DASHBOARD_LOGS_DIR", str(tmp_path / "logs"))
-    monkeypatch.setenv("ROONIE_PROVIDERS_CONFIG_PATH", str(tmp_path / "data" / "providers_config.json"))
-    monkeypatch.setenv("ROONIE_ROUTING_CONFIG_PATH", str(tmp_path / "data" / "routing_config.json"))
 
+def _run(payload: Dict[str, Any], *, emit_outputs: bool) -> tuple[Path, Dict[str, Any]]:
+    out_path = run_payload(payload, emit_outputs=emit_outputs)
+    return out_path, conftest._read_json(out_path)
 
-def _live_input(event_id: str, message: str, *, extra_metadata: Dict[str, Any] | None = None) -> Dict[str, Any]:
-    metadata: Dict[str, Any] = {
-        "user": "ruleofrune",
-        "is_direct_mention": True,
-        "mode": "live",
-        "platform": "twitch",
+
+def _run_nofile(payload: Dict[str, Any], **kw: Any) -> Dict[str, Any]:
+    return build_run_doc(payload, **kw)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _no_typing_delay():
+    # Nothing in this module asserts on typing delay; skip the simulated sleep.
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("ROONIE_TYPING_DELAY_ENABLED", "0")
+        yield
+
+
+@pytest.fixture
+def runtime_paths(tmp_path: Path):
+    """Point dashboard/provider paths at tmp_path with one environ update."""
+    root = os.fspath(tmp_path)
+    data = os.path.join(root, "data")
+    env = {
+        "ROONIE_DASHBOARD_RUNS_DIR": os.path.join(root, "runs"),
+        "ROONIE_DASHBOARD_DATA_DIR": data,
+        "ROONIE_DASHBOARD_LOGS_DIR": os.path.join(root, "logs"),
+        "ROONIE_PROVIDERS_CONFIG_PATH": os.path.join(data, "providers_config.json"),
+        "ROONIE_ROUTING_CONFIG_PATH": os.path.join(data, "routing_config.json"),
     }
-    if isinstance(extra_metadata, dict):
-        metadata.update(extra_metadata)
+    saved = {k: os.environ.get(k) for k in env}
+    os.environ.update(env)
+    yield tmp_path
+    for k, v in saved.items():
+        if v is None:
+            os.environ.pop(k, None)
+        else:
+            os.environ[k] = v
+
+
+@pytest.fixture
+def live_env(monkeypatch, runtime_paths: Path) -> SimpleNamespace:
+    """Open output gates and capture Twitch sends."""
+    monkeypatch.setenv("ROONIE_OUTPUT_DISABLED", "0")
+    monkeypatch.setenv("ROONIE_DRY_RUN", "0")
+    monkeypatch.setenv("ROONIE_OUTPUT_RATE_LIMIT_SECONDS", "0")
+
+    # Tests only count sends, so record a marker rather than copying payloads.
+    sent_calls: List[None] = []
+
+    def _spy_handle_output(self, output: Dict[str, Any], metadata: Dict[str, Any]) -> None:
+        sent_calls.append(None)
+
+    monkeypatch.setattr(_TOA, "handle_output", _spy_handle_output)
+    return SimpleNamespace(sent_calls=sent_calls, monkeypatch=monkeypatch, tmp_path=runtime_paths)
+
+
+# Shared across inputs: run_payload copies metadata before touching it.
+_BASE_META: Dict[str, Any] = {
+    "user": "ruleofrune",
+    "is_direct_mention": True,
+    "mode": "live",
+    "platform": "twitch",
+}
+
+
+def _live_input(event_id: str, message: str, *, extra_metadata: Dict[str, Any] | None = None) -> Dict[str, Any]:
+    metadata = {**_BASE_META, **extra_metadata} if extra_metadata else _BASE_META
     return {
         "event_id": event_id,
         "message": message,
@@ -32,99 +95,137 @@ def _live_input(event_id: str, message: str, *, extra_metadata: Dict[str, Any] |
     }
 
 
-def _provider_event_stub(category: str, response_text: str, approved_emotes: List[str] | None = None):
-    emotes = list(approved_emotes or [])
+@functools.lru_cache(maxsize=32)
+def _provider_event_stub(category: str, response_text: str, approved_emotes: Tuple[str, ...] = ()):
+    # Everything except the event-specific proposal fields is fixed per stub; build it once.
+    # Sub-dicts stay plain dicts (not MappingProxyType): output_gate requires dict traces.
+    trace_base = {
+        "director": {"type": "ProviderDirector"},
+        "behavior": {
+            "category": category,
+            "approved_emotes": list(approved_emotes),
+        },
+    }
+    proposal_base = {
+        "text": response_text,
+        "provider_used": "openai",
+        "route_used": "primary:openai",
+        "moderation_status": "allow",
+        "token_usage_if_available": None,
+    }
+    template = DecisionRecord(
+        case_id="live",
+        event_id="",
+        action="RESPOND_PUBLIC",
+        route="primary:openai",
+        response_text=response_text,
+        trace={},
+        context_active=False,
+        context_turns_used=0,
+    )
 
     def _stub(self, event: Event, env: Env) -> DecisionRecord:
-        session_id = str(event.metadata.get("session_id", "")).strip() or None
-        return DecisionRecord(
-            case_id="live",
-            event_id=event.event_id,
-            action="RESPOND_PUBLIC",
-            route="primary:openai",
-            response_text=response_text,
-            trace={
-                "director": {"type": "ProviderDirector"},
-                "behavior": {
-                    "category": category,
-                    "approved_emotes": emotes,
-                },
-                "proposal": {
-                    "text": response_text,
-                    "message_text": event.message,
-                    "provider_used": "openai",
-                    "route_used": "primary:openai",
-                    "moderation_status": "allow",
-                    "session_id": session_id,
-                    "token_usage_if_available": None,
-                },
-            },
-            context_active=False,
-            context_turns_used=0,
-        )
+        sid = event.metadata.get("session_id")
+        session_id = (sid.strip() if isinstance(sid, str) else None) or None
+        proposal = {**proposal_base, "message_text": event.message, "session_id": session_id}
+        trace = {**trace_base, "proposal": proposal}
+        return dataclasses.replace(template, event_id=event.event_id, trace=trace)
 
     return _stub
 
 
-def test_event_cooldown_suppresses_second_follow_and_no_second_send(tmp_path, monkeypatch) -> None:
-    import responders.output_gate as output_gate
-
-    _set_runtime_paths(monkeypatch, tmp_path)
-    monkeypatch.setenv("ROONIE_OUTPUT_DISABLED", "0")
-    monkeypatch.setenv("ROONIE_OUTPUT_RATE_LIMIT_SECONDS", "0")
-    output_gate._LAST_EMIT_TS = 0.0
-    output_gate._LAST_EMIT_BY_KEY.clear()
-
-    sent_calls: List[Dict[str, Any]] = []
-
-    def _spy_handle_output(self, output: Dict[str, Any], metadata: Dict[str, Any]) -> None:
-        sent_calls.append({"output": dict(output), "metadata": dict(metadata)})
-
-    monkeypatch.setattr("adapters.twitch_output.TwitchOutputAdapter.handle_output", _spy_handle_output)
-    monkeypatch.setattr(
-        "roonie.provider_director.ProviderDirector.evaluate",
-        _provider_event_stub("EVENT_FOLLOW", "Thanks for the follow!"),
-    )
-
-    out_path = run_payload(
+_MSG_DOJO: Final[str] = (
+    "dojo grooves locked in tonight and the room is staying steady through every transition "
+    "while the camera angle holds the booth view, the crowd clips keep cycling, and the pacing feels smooth "
+    "from intro section through the long break without any sudden shifts."
+)
+
+_MSG_SHOWING: Final[str] = (
+    "showing support all stream and the vibe is stable from first drop to last blend "
+    "with everyone hanging through the long section while lights, overlays, and chat pace stay balanced "
+    "across the full run without extra prompts or interruptions."
+)
+
+_MSG_SHOW: Final[str] = (
+    "show everyone the angle and keep the sequence moving while the booth cam stays centered, "
+    "chat remains calm, and the long transition keeps rolling with the same lane from one section to the next "
+    "without breaking focus on the current energy."
+)
+
+
+_HOW_POOL: Final[frozenset[str]] = frozenset(
+    {"I'm good. glad you're here", "doing well. this set is helping", "all good up here on the booth"}
+)
+
+
+# Canned route_generate replies, keyed by the payload session_id.
+_CANNED: Dict[str, str] = {
+    "phase19-greeting-open": "Hey, welcome in.",
+    "phase19-greeting-cooldown": "Hey there.",
+    "phase19-no-emote-inject": "Hey there",
+    "phase19-emote-spacing-normalize": "@c0rcyra booth duty all night.ruleof6Paws",
+    "phase19-stub-sanitize": "[openai stub] massive prompt echo",
+}
+
+
+def _canned_route(**kwargs) -> str:
+    return _CANNED[kwargs["context"]["session_id"]]
+
+
+_STUB_FOLLOW = _provider_event_stub("EVENT_FOLLOW", "Thanks for the follow!")
+_STUB_SUB = _provider_event_stub("EVENT_SUB", "Thanks for the sub!")
+_STUB_SUB_BADEMOTE = _provider_event_stub("EVENT_SUB", "Thanks BadEmote", approved_emotes=("RoonieWave",))
+
+
+@pytest.mark.parametrize(
+    "target, attr, replacement, session_id, messages, category, reason",
+    [
+        (
+            _PD,
+            "evaluate",
+            _STUB_FOLLOW,
+            "phase19-follow-cooldown",
+            ("@RoonieTheCat follow event 1", "@RoonieTheCat follow event 2"),
+            "EVENT_FOLLOW",
+            "EVENT_COOLDOWN",
+        ),
+        (
+            _pd_mod,
+            "route_generate",
+            _canned_route,
+            "phase19-greeting-cooldown",
+            ("@RoonieTheCat hey", "@RoonieTheCat hello"),
+            "GREETING",
+            "GREETING_COOLDOWN",
+        ),
+    ],
+    ids=["event_follow", "direct_greeting"],
+)
+def test_category_cooldown_suppresses_second_message(
+    live_env, target, attr, replacement, session_id, messages, category, reason
+) -> None:
+    live_env.monkeypatch.setattr(target, attr, replacement)
+
+    outputs = _run_nofile(
         {
-            "session_id": "phase19-follow-cooldown",
+            "session_id": session_id,
             "active_director": "ProviderDirector",
-            "inputs": [
-                _live_input("evt-1", "@RoonieTheCat follow event 1"),
-                _live_input("evt-2", "@RoonieTheCat follow event 2"),
-            ],
+            "inputs": [_live_input(f"evt-{i}", msg) for i, msg in enumerate(messages, start=1)],
         },
         emit_outputs=True,
-    )
-    run_doc = json.loads(out_path.read_text(encoding="utf-8"))
-    outputs = run_doc["outputs"]
+    )["outputs"]
     assert outputs[0]["emitted"] is True
-    assert outputs[1]["emitted"] is False
-    assert outputs[1]["reason"] == "EVENT_COOLDOWN"
-    assert outputs[1]["category"] == "EVENT_FOLLOW"
-    assert len(sent_calls) == 1
-
-
-def test_direct_address_greeting_emits_when_gates_open(tmp_path, monkeypatch) -> None:
-    import responders.output_gate as output_gate
-
-    _set_runtime_paths(monkeypatch, tmp_path)
-    monkeypatch.setenv("ROONIE_OUTPUT_DISABLED", "0")
-    monkeypatch.setenv("ROONIE_DRY_RUN", "0")
-    monkeypatch.setenv("ROONIE_OUTPUT_RATE_LIMIT_SECONDS", "0")
-    output_gate._LAST_EMIT_TS = 0.0
-    output_gate._LAST_EMIT_BY_KEY.clear()
-
-    sent_calls: List[Dict[str, Any]] = []
+    second = outputs[1]
+    assert second["emitted"] is False
+    assert second["reason"] == reason
+    assert second["category"] == category
+    assert len(live_env.sent_calls) == 1
 
-    def _spy_handle_output(self, output: Dict[str, Any], metadata: Dict[str, Any]) -> None:
-        sent_calls.append({"output": dict(output), "metadata": dict(metadata)})
 
-    monkeypatch.setattr("adapters.twitch_output.TwitchOutputAdapter.handle_output", _spy_handle_output)
-    monkeypatch.setattr("roonie.provider_director.route_generate", lambda **kwargs: "Hey, welcome in.")
+def test_direct_address_greeting_emits_when_gates_open(live_env) -> None:
+    live_env.monkeypatch.setattr(_pd_mod, "route_generate", _canned_route)
 
-    out_path = run_payload(
+    _, run_doc = _run(
         {
             "session_id": "phase19-greeting-open",
             "active_director": "ProviderDirector",
@@ -132,69 +233,21 @@ def test_direct_address_greeting_emits_when_gates_open(tmp_path, monkeypatch) ->
         },
         emit_outputs=True,
     )
-    run_doc = json.loads(out_path.read_text(encoding="utf-8"))
     decision = run_doc["decisions"][0]
     output = run_doc["outputs"][0]
     assert decision["action"] == "RESPOND_PUBLIC"
     assert decision["route"].startswith("primary:")
     assert output["emitted"] is True
     assert output["reason"] == "EMITTED"
-    assert len(sent_calls) == 1
+    assert len(live_env.sent_calls) == 1
 
 
-def test_direct_address_greeting_cooldown_suppresses_second_message(tmp_path, monkeypatch) -> None:
-    import responders.output_gate as output_gate
+def test_disarmed_still_suppresses_event_category(live_env) -> None:
+    live_env.monkeypatch.setenv("ROONIE_OUTPUT_DISABLED", "1")
 
-    _set_runtime_paths(monkeypatch, tmp_path)
-    monkeypatch.setenv("ROONIE_OUTPUT_DISABLED", "0")
-    monkeypatch.setenv("ROONIE_DRY_RUN", "0")
-    monkeypatch.setenv("ROONIE_OUTPUT_RATE_LIMIT_SECONDS", "0")
-    output_gate._LAST_EMIT_TS = 0.0
-    output_gate._LAST_EMIT_BY_KEY.clear()
+    live_env.monkeypatch.setattr(_PD, "evaluate", _STUB_SUB)
 
-    sent_calls: List[Dict[str, Any]] = []
-
-    def _spy_handle_output(self, output: Dict[str, Any], metadata: Dict[str, Any]) -> None:
-        sent_calls.append({"output": dict(output), "metadata": dict(metadata)})
-
-    monkeypatch.setattr("adapters.twitch_output.TwitchOutputAdapter.handle_output", _spy_handle_output)
-    monkeypatch.setattr("roonie.provider_director.route_generate", lambda **kwargs: "Hey there.")
-
-    out_path = run_payload(
-        {
-            "session_id": "phase19-greeting-cooldown",
-            "active_director": "ProviderDirector",
-            "inputs": [
-                _live_input("evt-1", "@RoonieTheCat hey"),
-                _live_input("evt-2", "@RoonieTheCat hello"),
-            ],
-        },
-        emit_outputs=True,
-    )
-    run_doc = json.loads(out_path.read_text(encoding="utf-8"))
-    outputs = run_doc["outputs"]
-    assert outputs[0]["emitted"] is True
-    assert outputs[1]["emitted"] is False
-    assert outputs[1]["reason"] == "GREETING_COOLDOWN"
-    assert len(sent_calls) == 1
-
-
-def test_disarmed_still_suppresses_event_category(tmp_path, monkeypatch) -> None:
-    _set_runtime_paths(monkeypatch, tmp_path)
-    monkeypatch.setenv("ROONIE_OUTPUT_DISABLED", "1")
-
-    sent_calls: List[Dict[str, Any]] = []
-
-    def _spy_handle_output(self, output: Dict[str, Any], metadata: Dict[str, Any]) -> None:
-        sent_calls.append({"output": dict(output), "metadata": dict(metadata)})
-
-    monkeypatch.setattr("adapters.twitch_output.TwitchOutputAdapter.handle_output", _spy_handle_output)
-    monkeypatch.setattr(
-        "roonie.provider_director.ProviderDirector.evaluate",
-        _provider_event_stub("EVENT_SUB", "Thanks for the sub!"),
-    )
-
-    out_path = run_payload(
+    _, run_doc = _run(
         {
             "session_id": "phase19-disarmed-event",
             "active_director": "ProviderDirector",
@@ -202,20 +255,16 @@ def test_disarmed_still_suppresses_event_category(tmp_path, monkeypatch) -> None
         },
         emit_outputs=True,
     )
-    run_doc = json.loads(out_path.read_text(encoding="utf-8"))
-    assert run_doc["outputs"][0]["emitted"] is False
-    assert run_doc["outputs"][0]["reason"] == "OUTPUT_DISABLED"
-    assert sent_calls == []
+    output = run_doc["outputs"][0]
+    assert output["emitted"] is False
+    assert output["reason"] == "OUTPUT_DISABLED"
+    assert live_env.sent_calls == []
 
 
 def test_noop_action_uses_noop_reason_not_action_not_allowed(monkeypatch) -> None:
-    import responders.output_gate as output_gate
-
     monkeypatch.setenv("ROONIE_OUTPUT_DISABLED", "0")
     monkeypatch.setenv("ROONIE_DRY_RUN", "0")
     monkeypatch.setenv("ROONIE_OUTPUT_RATE_LIMIT_SECONDS", "0")
-    output_gate._LAST_EMIT_TS = 0.0
-    output_gate._LAST_EMIT_BY_KEY.clear()
 
     outputs = output_gate.maybe_emit(
         [
@@ -233,8 +282,7 @@ def test_noop_action_uses_noop_reason_not_action_not_allowed(monkeypatch) -> Non
     assert outputs[0]["reason"] == "NOOP"
 
 
-def test_track_id_without_now_playing_goes_through_llm(tmp_path, monkeypatch) -> None:
-    _set_runtime_paths(monkeypatch, tmp_path)
+def test_track_id_without_now_playing_goes_through_llm(runtime_paths, monkeypatch) -> None:
     monkeypatch.setenv("ROONIE_OUTPUT_DISABLED", "0")
 
     captured: Dict[str, Any] = {}
@@ -245,9 +293,9 @@ def test_track_id_without_now_playing_goes_through_llm(tmp_path, monkeypatch) ->
         kwargs["context"]["moderation_result"] = "allow"
         return "Not sure, drop a timestamp and I can check."
 
-    monkeypatch.setattr("roonie.provider_director.route_generate", _stub_route_generate)
+    monkeypatch.setattr(_pd_mod, "route_generate", _stub_route_generate)
 
-    out_path = run_payload(
+    run_doc = _run_nofile(
         {
             "session_id": "phase19-track-id",
             "active_director": "ProviderDirector",
@@ -255,7 +303,6 @@ def test_track_id_without_now_playing_goes_through_llm(tmp_path, monkeypatch) ->
         },
         emit_outputs=False,
     )
-    run_doc = json.loads(out_path.read_text(encoding="utf-8"))
     decision = run_doc["decisions"][0]
     assert decision["action"] == "RESPOND_PUBLIC"
     assert decision["route"].startswith("primary:")
@@ -265,8 +312,7 @@ def test_track_id_without_now_playing_goes_through_llm(tmp_path, monkeypatch) ->
     assert "Don't guess track names" in prompt or "don't have track info" in prompt.lower()
 
 
-def test_trigger_word_boundaries_prevent_prefix_false_positives(tmp_path, monkeypatch) -> None:
-    _set_runtime_paths(monkeypatch, tmp_path)
+def test_trigger_word_boundaries_prevent_prefix_false_positives(runtime_paths, monkeypatch) -> None:
     monkeypatch.setenv("ROONIE_OUTPUT_DISABLED", "0")
 
     called = {"count": 0}
@@ -277,45 +323,31 @@ def test_trigger_word_boundaries_prevent_prefix_false_positives(tmp_path, monkey
         kwargs["context"]["moderation_result"] = "allow"
         return "unexpected trigger"
 
-    monkeypatch.setattr("roonie.provider_director.route_generate", _stub_route_generate)
+    monkeypatch.setattr(_pd_mod, "route_generate", _stub_route_generate)
 
-    msg_dojo = (
-        "dojo grooves locked in tonight and the room is staying steady through every transition "
-        "while the camera angle holds the booth view, the crowd clips keep cycling, and the pacing feels smooth "
-        "from intro section through the long break without any sudden shifts."
-    )
-    msg_showing = (
-        "showing support all stream and the vibe is stable from first drop to last blend "
-        "with everyone hanging through the long section while lights, overlays, and chat pace stay balanced "
-        "across the full run without extra prompts or interruptions."
-    )
-
-    out_path = run_payload(
+    run_doc = _run_nofile(
         {
             "session_id": "phase19-trigger-boundary-noop",
             "active_director": "ProviderDirector",
             "inputs": [
-                _live_input("evt-1", msg_dojo),
-                _live_input("evt-2", msg_showing),
+                _live_input("evt-1", _MSG_DOJO),
+                _live_input("evt-2", _MSG_SHOWING),
             ],
         },
         emit_outputs=False,
     )
-    run_doc = json.loads(out_path.read_text(encoding="utf-8"))
     decisions = run_doc["decisions"]
-    assert decisions[0]["action"] == "NOOP"
-    assert decisions[1]["action"] == "NOOP"
-    assert decisions[0]["trace"]["director"]["trigger"] is False
-    assert decisions[1]["trace"]["director"]["trigger"] is False
-    assert decisions[0]["trace"]["behavior"]["category"] == "OTHER"
-    assert decisions[1]["trace"]["behavior"]["category"] == "OTHER"
-    assert decisions[0]["trace"]["behavior"]["short_ack_preferred"] is False
-    assert decisions[1]["trace"]["behavior"]["short_ack_preferred"] is False
+    for decision in decisions[:2]:
+        trace = decision["trace"]
+        behavior = trace["behavior"]
+        assert decision["action"] == "NOOP"
+        assert trace["director"]["trigger"] is False
+        assert behavior["category"] == "OTHER"
+        assert behavior["short_ack_preferred"] is False
     assert called["count"] == 0
 
 
-def test_trigger_word_boundaries_still_allow_direct_request(tmp_path, monkeypatch) -> None:
-    _set_runtime_paths(monkeypatch, tmp_path)
+def test_trigger_word_boundaries_still_allow_direct_request(runtime_paths, monkeypatch) -> None:
     monkeypatch.setenv("ROONIE_OUTPUT_DISABLED", "0")
 
     captured: Dict[str, Any] = {}
@@ -326,58 +358,39 @@ def test_trigger_word_boundaries_still_allow_direct_request(tmp_path, monkeypatc
         kwargs["context"]["moderation_result"] = "allow"
         return "on it"
 
-    monkeypatch.setattr("roonie.provider_director.route_generate", _stub_route_generate)
-
-    msg_show = (
-        "show everyone the angle and keep the sequence moving while the booth cam stays centered, "
-        "chat remains calm, and the long transition keeps rolling with the same lane from one section to the next "
-        "without breaking focus on the current energy."
-    )
+    monkeypatch.setattr(_pd_mod, "route_generate", _stub_route_generate)
 
-    out_path = run_payload(
+    run_doc = _run_nofile(
         {
             "session_id": "phase19-trigger-boundary-direct",
             "active_director": "ProviderDirector",
-            "inputs": [_live_input("evt-1", msg_show)],
+            "inputs": [_live_input("evt-1", _MSG_SHOW)],
         },
         emit_outputs=False,
     )
-    run_doc = json.loads(out_path.read_text(encoding="utf-8"))
     decision = run_doc["decisions"][0]
+    trace = decision["trace"]
+    behavior = trace["behavior"]
     assert decision["action"] == "RESPOND_PUBLIC"
-    assert decision["trace"]["director"]["trigger"] is True
-    assert decision["trace"]["behavior"]["category"] == "OTHER"
-    assert decision["trace"]["behavior"]["short_ack_preferred"] is False
+    assert trace["director"]["trigger"] is True
+    assert behavior["category"] == "OTHER"
+    assert behavior["short_ack_preferred"] is False
     assert decision["response_text"] == "on it"
     assert "show everyone the angle" in str(captured.get("prompt", "")).lower()
 
 
-def test_direct_address_long_statement_prefers_short_ack_and_emits(tmp_path, monkeypatch) -> None:
-    import responders.output_gate as output_gate
-
-    _set_runtime_paths(monkeypatch, tmp_path)
-    monkeypatch.setenv("ROONIE_OUTPUT_DISABLED", "0")
-    monkeypatch.setenv("ROONIE_DRY_RUN", "0")
-    monkeypatch.setenv("ROONIE_OUTPUT_RATE_LIMIT_SECONDS", "0")
-    output_gate._LAST_EMIT_TS = 0.0
-    output_gate._LAST_EMIT_BY_KEY.clear()
-
-    sent_calls: List[Dict[str, Any]] = []
+def test_direct_address_long_statement_prefers_short_ack_and_emits(live_env) -> None:
     captured: Dict[str, Any] = {}
 
-    def _spy_handle_output(self, output: Dict[str, Any], metadata: Dict[str, Any]) -> None:
-        sent_calls.append({"output": dict(output), "metadata": dict(metadata)})
-
     def _stub_route_generate(**kwargs):
         captured["prompt"] = kwargs.get("prompt", "")
         kwargs["context"]["provider_selected"] = "openai"
         kwargs["context"]["moderation_result"] = "allow"
         return "@ruleofrune got you. hang here as long as you need."
 
-    monkeypatch.setattr("adapters.twitch_output.TwitchOutputAdapter.handle_output", _spy_handle_output)
-    monkeypatch.setattr("roonie.provider_director.route_generate", _stub_route_generate)
+    live_env.monkeypatch.setattr(_pd_mod, "route_generate", _stub_route_generate)
 
-    out_path = run_payload(
+    _, run_doc = _run(
         {
             "session_id": "phase19-direct-status-ack",
             "active_director": "ProviderDirector",
@@ -390,59 +403,42 @@ def test_direct_address_long_statement_prefers_short_ack_and_emits(tmp_path, mon
         },
         emit_outputs=True,
     )
-    run_doc = json.loads(out_path.read_text(encoding="utf-8"))
     decision = run_doc["decisions"][0]
     output = run_doc["outputs"][0]
+    behavior = decision["trace"]["behavior"]
     assert decision["action"] == "RESPOND_PUBLIC"
-    assert decision["trace"]["behavior"]["category"] == "BANTER"
-    assert decision["trace"]["behavior"]["short_ack_preferred"] is True
+    assert behavior["category"] == "BANTER"
+    assert behavior["short_ack_preferred"] is True
     assert output["emitted"] is True
     assert output["reason"] == "EMITTED"
-    assert len(sent_calls) == 1
+    assert len(live_env.sent_calls) == 1
     prompt = str(captured.get("prompt", ""))
     assert "short acknowledgment sentence" in prompt
 
 
-def test_disallowed_emote_is_suppressed_when_allow_list_present(tmp_path, monkeypatch) -> None:
-    import responders.output_gate as output_gate
+def test_disallowed_emote_is_suppressed_when_allow_list_present(live_env) -> None:
+    live_env.monkeypatch.setattr(_PD, "evaluate", _STUB_SUB_BADEMOTE)
 
-    _set_runtime_paths(monkeypatch, tmp_path)
-    monkeypatch.setenv("ROONIE_OUTPUT_DISABLED", "0")
-    monkeypatch.setenv("ROONIE_OUTPUT_RATE_LIMIT_SECONDS", "0")
-    output_gate._LAST_EMIT_TS = 0.0
-    output_gate._LAST_EMIT_BY_KEY.clear()
-
-    sent_calls: List[Dict[str, Any]] = []
-
-    def _spy_handle_output(self, output: Dict[str, Any], metadata: Dict[str, Any]) -> None:
-        sent_calls.append({"output": dict(output), "metadata": dict(metadata)})
-
-    monkeypatch.setattr("adapters.twitch_output.TwitchOutputAdapter.handle_output", _spy_handle_output)
-    monkeypatch.setattr(
-        "roonie.provider_director.ProviderDirector.evaluate",
-        _provider_event_stub("EVENT_SUB", "Thanks BadEmote", approved_emotes=["RoonieWave"]),
-    )
-
-    out_path = run_payload(
+    output = _run_nofile(
         {
             "session_id": "phase19-emote-allowlist",
             "active_director": "ProviderDirector",
-            "inputs": [_live_input("evt-1", "@RoonieTheCat sub event", extra_metadata={"approved_emotes": ["RoonieWave"]})],
+            "inputs": [
+                _live_input("evt-1", "@RoonieTheCat sub event", extra_metadata={"approved_emotes": ["RoonieWave"]})
+            ],
         },
         emit_outputs=True,
-    )
-    run_doc = json.loads(out_path.read_text(encoding="utf-8"))
-    assert run_doc["outputs"][0]["emitted"] is False
-    assert run_doc["outputs"][0]["reason"] == "DISALLOWED_EMOTE"
-    assert sent_calls == []
+    )["outputs"][0]
+    assert output["emitted"] is False
+    assert output["reason"] == "DISALLOWED_EMOTE"
+    assert live_env.sent_calls == []
 
 
-def test_no_allow_list_does_not_auto_inject_emotes(tmp_path, monkeypatch) -> None:
-    _set_runtime_paths(monkeypatch, tmp_path)
+def test_no_allow_list_does_not_auto_inject_emotes(runtime_paths, monkeypatch) -> None:
     monkeypatch.setenv("ROONIE_OUTPUT_DISABLED", "0")
-    monkeypatch.setattr("roonie.provider_director.route_generate", lambda **kwargs: "Hey there")
+    monkeypatch.setattr(_pd_mod, "route_generate", _canned_route)
 
-    out_path = run_payload(
+    run_doc = _run_nofile(
         {
             "session_id": "phase19-no-emote-inject",
             "active_director": "ProviderDirector",
@@ -450,22 +446,18 @@ def test_no_allow_list_does_not_auto_inject_emotes(tmp_path, monkeypatch) -> Non
         },
         emit_outputs=False,
     )
-    run_doc = json.loads(out_path.read_text(encoding="utf-8"))
     decision = run_doc["decisions"][0]
-    assert decision["response_text"] == "Hey there"
-    assert "RoonieWave" not in decision["response_text"]
-    assert "RoonieHi" not in decision["response_text"]
+    response_text = decision["response_text"]
+    assert response_text == "Hey there"
+    assert "RoonieWave" not in response_text
+    assert "RoonieHi" not in response_text
 
 
-def test_attached_approved_emote_token_is_spacing_normalized(tmp_path, monkeypatch) -> None:
-    _set_runtime_paths(monkeypatch, tmp_path)
+def test_attached_approved_emote_token_is_spacing_normalized(runtime_paths, monkeypatch) -> None:
     monkeypatch.setenv("ROONIE_OUTPUT_DISABLED", "0")
-    monkeypatch.setattr(
-        "roonie.provider_director.route_generate",
-        lambda **kwargs: "@c0rcyra booth duty all night.ruleof6Paws",
-    )
+    monkeypatch.setattr(_pd_mod, "route_generate", _canned_route)
 
-    out_path = run_payload(
+    run_doc = _run_nofile(
         {
             "session_id": "phase19-emote-spacing-normalize",
             "active_director": "ProviderDirector",
@@ -479,22 +471,17 @@ def test_attached_approved_emote_token_is_spacing_normalized(tmp_path, monkeypat
         },
         emit_outputs=False,
     )
-    run_doc = json.loads(out_path.read_text(encoding="utf-8"))
     decision = run_doc["decisions"][0]
     assert decision["action"] == "RESPOND_PUBLIC"
     assert decision["response_text"] == "@c0rcyra booth duty all night. ruleof6Paws"
 
 
-def test_live_stub_output_is_sanitized_when_flag_enabled(tmp_path, monkeypatch) -> None:
-    _set_runtime_paths(monkeypatch, tmp_path)
+def test_live_stub_output_is_sanitized_when_flag_enabled(runtime_paths, monkeypatch) -> None:
     monkeypatch.setenv("ROONIE_OUTPUT_DISABLED", "0")
     monkeypatch.setenv("ROONIE_SANITIZE_PROVIDER_STUB_OUTPUT", "1")
-    monkeypatch.setattr(
-        "roonie.provider_director.route_generate",
-        lambda **kwargs: "[openai stub] massive prompt echo",
-    )
+    monkeypatch.setattr(_pd_mod, "route_generate", _canned_route)
 
-    out_path = run_payload(
+    run_doc = _run_nofile(
         {
             "session_id": "phase19-stub-sanitize",
             "active_director": "ProviderDirector",
@@ -502,9 +489,7 @@ def test_live_stub_output_is_sanitized_when_flag_enabled(tmp_path, monkeypatch)
         },
         emit_outputs=False,
     )
-    run_doc = json.loads(out_path.read_text(encoding="utf-8"))
     decision = run_doc["decisions"][0]
     assert decision["action"] == "RESPOND_PUBLIC"
     # Stub pool — any valid how-are banter response is acceptable
-    _HOW_POOL = {"I'm good. glad you're here", "doing well. this set is helping", "all good up here on the booth"}
     assert decision["response_text"] in _HOW_POOL
@@ -1,28 +1,53 @@
 ﻿from __future__ import annotations
 
+import dataclasses
+import functools
 import json
 from pathlib import Path
 
+import pytest
+
 from providers.registry import ProviderRegistry
-from roonie.context.context_buffer import ContextBuffer
+from roonie.context.context_buffer import ContextBuffer, ContextTurn
 from roonie.live_director import LiveDirector
 from roonie.types import Env, Event
 
 
+@functools.lru_cache(maxsize=None)
 def _load_fixture(name: str) -> dict:
+    # Fixture files are immutable; callers that mutate the result must copy it first.
     p = Path("tests/fixtures/v1_12a_context") / name
-    return json.loads(p.read_text(encoding="utf-8"))
+    return json.loads(p.read_bytes())
+
+
+@pytest.fixture(scope="module")
+def job_construction_fx() -> dict:
+    return _load_fixture("case_job_then_construction.json")
+
+
+@pytest.fixture(scope="module")
+def _job_construction_proto(job_construction_fx) -> LiveDirector:
+    reg = ProviderRegistry.from_dict(job_construction_fx["provider_cfg"])
+    return LiveDirector(registry=reg, routing_cfg=job_construction_fx["routing_cfg"])
+
+
+@pytest.fixture
+def live_director(_job_construction_proto) -> LiveDirector:
+    # Registry and routing config are read-only; only the context buffer carries state.
+    return dataclasses.replace(_job_construction_proto, context_buffer=ContextBuffer(max_turns=12))
 
 
 def test_context_buffer_never_exceeds_n() -> None:
     buf = ContextBuffer(max_turns=3)
-    for i in range(5):
-        stored = buf.add_turn(
-            speaker="user",
-            text=f"what is track {i}?",
-            tags={"direct_address": False, "category": "utility_track_id"},
-        )
-        assert stored is True
+    stored = buf.add_turns(
+        {
+            "speaker": "user",
+            "text": f"what is track {i}?",
+            "tags": {"direct_address": False, "category": "utility_track_id"},
+        }
+        for i in range(5)
+    )
+    assert stored == [True] * 5
 
     turns = buf.get_context(max_turns=3)
     assert len(turns) == 3
@@ -30,6 +55,51 @@ def test_context_buffer_never_exceeds_n() -> None:
     assert turns[2].text == "what is track 4?"
 
 
+def test_get_user_turns_filters_recent_turns_by_viewer() -> None:
+    buf = ContextBuffer(max_turns=4)
+    buf.add_turns(
+        {
+            "speaker": "user",
+            "text": f"what is track {i}?",
+            "tags": {"direct_address": True, "user": user},
+        }
+        for i, user in enumerate(["Fraggy", "viewer_b", "fraggy", "viewer_b", "FRAGGY"])
+    )
+
+    turns = buf.get_user_turns("Fraggy")
+    assert [t.text for t in turns] == ["what is track 2?", "what is track 4?"]
+    assert [t.text for t in buf.get_user_turns("fraggy", max_turns=2)] == ["what is track 4?"]
+    assert buf.get_user_turns("") == []
+
+
+def test_get_user_turns_tracks_eviction() -> None:
+    buf = ContextBuffer(max_turns=3)
+    buf.add_turns(
+        {
+            "speaker": "user",
+            "text": f"what is track {i}?",
+            "tags": {"direct_address": True, "user": user},
+        }
+        for i, user in enumerate(["Fraggy", "viewer_b", "fraggy", "viewer_b"])
+    )
+
+    assert [t.text for t in buf.get_user_turns("FRAGGY")] == ["what is track 2?"]
+    assert [t.text for t in buf.get_user_turns("viewer_b")] == ["what is track 1?", "what is track 3?"]
+    buf.clear()
+    assert buf.get_user_turns("viewer_b") == []
+
+
+def test_bulk_add_skips_gates_and_keeps_newest() -> None:
+    buf = ContextBuffer(max_turns=3)
+    buf.bulk_add(
+        ContextTurn(ts="t", speaker="user", text=f"lol {i}", tags={"user": "viewer_a"})
+        for i in range(5)
+    )
+
+    assert [t.text for t in buf.get_context(max_turns=3)] == ["lol 2", "lol 3", "lol 4"]
+    assert len(buf.get_user_turns("viewer_a")) == 3
+
+
 def test_irrelevant_chatter_is_not_stored() -> None:
     buf = ContextBuffer(max_turns=3)
     stored = buf.add_turn(
@@ -49,21 +119,18 @@ def test_roonie_turn_requires_sent_and_related() -> None:
     assert buf.add_turn(speaker="roonie", text="sure", sent=True, related_to_stored_user=True) is True
 
 
-def test_fixture_job_then_construction_uses_recent_context() -> None:
-    fx = _load_fixture("case_job_then_construction.json")
-    reg = ProviderRegistry.from_dict(fx["provider_cfg"])
-    director = LiveDirector(registry=reg, routing_cfg=fx["routing_cfg"])
+def test_fixture_job_then_construction_uses_recent_context(job_construction_fx, live_director) -> None:
     env = Env(offline=False)
 
     decisions = []
-    for e in fx["events"]:
+    for e in job_construction_fx["events"]:
         event = Event(
             event_id=e["event_id"],
             message=e["message"],
             actor=e.get("actor", "viewer"),
             metadata=e.get("metadata", {}),
         )
-        decisions.append(director.evaluate(event, env))
+        decisions.append(live_director.evaluate(event, env))
 
     assert decisions[0].context_active is False
     assert decisions[0].context_turns_used == 0
@@ -2,11 +2,29 @@ from __future__ import annotations
 
 from typing import Any, Dict
 
+import pytest
+
+import roonie.provider_director as _pd_mod
 from roonie.behavior_spec import CATEGORY_BANTER, CATEGORY_GREETING, classify_behavior_category
 from roonie.provider_director import ProviderDirector
 from roonie.types import Env, Event
 
 
+_LIBRARY_GROUNDING = "Library grounding (local)"
+
+
+@pytest.fixture(scope="module")
+def _director_proto() -> ProviderDirector:
+    # Construction reads the persona policy file; do it once per module.
+    return ProviderDirector()
+
+
+@pytest.fixture
+def director(_director_proto) -> ProviderDirector:
+    _director_proto.reset()
+    return _director_proto
+
+
 def _live_event(event_id: str, message: str) -> Event:
     return Event(
         event_id=event_id,
@@ -37,7 +55,7 @@ def test_pure_greeting_stays_in_greeting_bucket() -> None:
     assert cat == CATEGORY_GREETING
 
 
-def test_provider_director_injects_topic_anchor_for_continuity(monkeypatch) -> None:
+def test_provider_director_injects_topic_anchor_for_continuity(monkeypatch, director) -> None:
     captured: Dict[str, Any] = {}
 
     def _stub_route_generate(**kwargs):
@@ -46,9 +64,8 @@ def test_provider_director_injects_topic_anchor_for_continuity(monkeypatch) -> N
         kwargs["context"]["moderation_result"] = "allow"
         return "ok"
 
-    monkeypatch.setattr("roonie.provider_director.route_generate", _stub_route_generate)
+    monkeypatch.setattr(_pd_mod, "route_generate", _stub_route_generate)
 
-    director = ProviderDirector()
     env = Env(offline=False)
 
     messages = [
@@ -66,7 +83,7 @@ def test_provider_director_injects_topic_anchor_for_continuity(monkeypatch) -> N
     assert "Recent topic: Maze 28" in prompt
 
 
-def test_topic_anchor_does_not_bleed_into_unrelated_banter(monkeypatch) -> None:
+def test_topic_anchor_does_not_bleed_into_unrelated_banter(monkeypatch, director) -> None:
     captured: Dict[str, Any] = {}
 
     def _stub_route_generate(**kwargs):
@@ -75,9 +92,8 @@ def test_topic_anchor_does_not_bleed_into_unrelated_banter(monkeypatch) -> None:
         kwargs["context"]["moderation_result"] = "allow"
         return "ok"
 
-    monkeypatch.setattr("roonie.provider_director.route_generate", _stub_route_generate)
+    monkeypatch.setattr(_pd_mod, "route_generate", _stub_route_generate)
 
-    director = ProviderDirector()
     env = Env(offline=False)
 
     director.evaluate(
@@ -90,11 +106,11 @@ def test_topic_anchor_does_not_bleed_into_unrelated_banter(monkeypatch) -> None:
     )
 
     prompt = str(captured.get("prompt") or "")
-    assert "Recent topic: Maze 28" not in prompt
-    assert "Library grounding (local)" not in prompt
+    leaked = [marker for marker in ("Recent topic: Maze 28", _LIBRARY_GROUNDING) if marker in prompt]
+    assert not leaked
 
 
-def test_topic_anchor_can_apply_to_general_topics_on_deictic_followup(monkeypatch) -> None:
+def test_topic_anchor_can_apply_to_general_topics_on_deictic_followup(monkeypatch, director) -> None:
     captured: Dict[str, Any] = {}
 
     def _stub_route_generate(**kwargs):
@@ -103,9 +119,8 @@ def test_topic_anchor_can_apply_to_general_topics_on_deictic_followup(monkeypatc
         kwargs["context"]["moderation_result"] = "allow"
         return "ok"
 
-    monkeypatch.setattr("roonie.provider_director.route_generate", _stub_route_generate)
+    monkeypatch.setattr(_pd_mod, "route_generate", _stub_route_generate)
 
-    director = ProviderDirector()
     env = Env(offline=False)
 
     director.evaluate(
@@ -118,12 +133,12 @@ def test_topic_anchor_can_apply_to_general_topics_on_deictic_followup(monkeypatc
     )
 
     prompt = str(captured.get("prompt") or "")
-    assert "Recent topic:" in prompt
-    assert "Maze" in prompt
-    assert "Library grounding (local)" not in prompt
+    missing = [marker for marker in ("Recent topic:", "Maze") if marker not in prompt]
+    assert not missing
+    assert _LIBRARY_GROUNDING not in prompt
 
 
-def test_provider_director_stores_assistant_turn_after_send_feedback(monkeypatch) -> None:
+def test_provider_director_stores_assistant_turn_after_send_feedback(monkeypatch, director) -> None:
     captured: Dict[str, Any] = {"prompts": []}
     replies = ["maze is still in heavy rotation", "same, that one stays on repeat"]
 
@@ -133,9 +148,8 @@ def test_provider_director_stores_assistant_turn_after_send_feedback(monkeypatch
         kwargs["context"]["moderation_result"] = "allow"
         return replies.pop(0)
 
-    monkeypatch.setattr("roonie.provider_director.route_generate", _stub_route_generate)
+    monkeypatch.setattr(_pd_mod, "route_generate", _stub_route_generate)
 
-    director = ProviderDirector()
     env = Env(offline=False)
 
     first = director.evaluate(_live_event("evt-1", "@RoonieTheCat maze 28 still slaps"), env)
@@ -158,7 +172,7 @@ def test_provider_director_stores_assistant_turn_after_send_feedback(monkeypatch
     assert "Roonie: maze is still in heavy rotation" in prompt
 
 
-def test_provider_director_does_not_store_assistant_turn_when_not_sent(monkeypatch) -> None:
+def test_provider_director_does_not_store_assistant_turn_when_not_sent(monkeypatch, director) -> None:
     captured: Dict[str, Any] = {"prompts": []}
     replies = ["this one gets wild", "you caught the mood right away"]
 
@@ -168,9 +182,8 @@ def test_provider_director_does_not_store_assistant_turn_when_not_sent(monkeypat
         kwargs["context"]["moderation_result"] = "allow"
         return replies.pop(0)
 
-    monkeypatch.setattr("roonie.provider_director.route_generate", _stub_route_generate)
+    monkeypatch.setattr(_pd_mod, "route_generate", _stub_route_generate)
 
-    director = ProviderDirector()
     env = Env(offline=False)
 
     first = director.evaluate(_live_event("evt-1", "@RoonieTheCat this part is nuts"), env)
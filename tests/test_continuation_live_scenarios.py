@@ -6,13 +6,51 @@ re-tagging after continuation, and edge cases that appear in real streams.
 """
 from __future__ import annotations
 
-from typing import Any, Dict, List
+import copy
+import os
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
 
+import pytest
+
+import roonie.provider_director as _pd_mod
+from roonie.context.context_buffer import ContextBuffer, ContextTurn
 from roonie.provider_director import ProviderDirector
-from roonie.types import Env, Event
+from roonie.types import Action, Env, Event
+
+
+# The module shares one director (see _director_proto), so keep it on a
+# single worker under ``pytest -n auto --dist=loadgroup``.
+pytestmark = pytest.mark.xdist_group("live_scenarios")
+
+SESSION = f"live-scenario-session-{os.environ.get('PYTEST_XDIST_WORKER', '0')}"
+
+_RESPOND_PUBLIC: Action = "RESPOND_PUBLIC"
+
+ENV_LIVE = Env(offline=False)
+
+_CLOCK_START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+_FLOOD_TS = _CLOCK_START.isoformat()
 
 
-SESSION = "live-scenario-session"
+class _FakeClock:
+    """Deterministic context-buffer clock: one second per stored turn."""
+
+    def __init__(self) -> None:
+        self.ticks = 0
+
+    def __call__(self) -> datetime:
+        now = _CLOCK_START + timedelta(seconds=self.ticks)
+        self.ticks += 1
+        return now
+
+
+def _new_director(clock: _FakeClock) -> ProviderDirector:
+    return ProviderDirector(context_buffer=ContextBuffer(max_turns=12, now_fn=clock))
+
+
+_BASE_METADATA: Dict[str, Any] = {"mode": "live", "platform": "twitch", "session_id": SESSION}
 
 
 def _event(
@@ -23,13 +61,9 @@ def _event(
     is_direct_mention: bool = False,
     metadata_extra: Dict[str, Any] | None = None,
 ) -> Event:
-    metadata = {
-        "user": user,
-        "is_direct_mention": is_direct_mention,
-        "mode": "live",
-        "platform": "twitch",
-        "session_id": SESSION,
-    }
+    metadata = _BASE_METADATA.copy()
+    metadata["user"] = user
+    metadata["is_direct_mention"] = is_direct_mention
     if isinstance(metadata_extra, dict):
         metadata.update(metadata_extra)
     return Event(
@@ -39,261 +73,267 @@ def _event(
     )
 
 
-def _stub_route(monkeypatch):
-    """Monkeypatch route_generate to return a canned response."""
-    captured: Dict[str, Any] = {}
-
-    def _stub(**kwargs):
-        captured["prompt"] = kwargs.get("prompt")
-        kwargs["context"]["provider_selected"] = "openai"
-        kwargs["context"]["moderation_result"] = "allow"
-        return "sure thing"
-
-    monkeypatch.setattr("roonie.provider_director.route_generate", _stub)
-    return captured
-
-
-def _say(director, env, event_id, message, *, user="c0rcyra", mention=False, send=True, metadata_extra=None):
-    """Helper: evaluate a message and optionally confirm send."""
-    e = _event(event_id, message, user=user, is_direct_mention=mention, metadata_extra=metadata_extra)
-    result = director.evaluate(e, env)
-    if send and result.action == "RESPOND_PUBLIC":
-        director.apply_output_feedback(
-            event_id=event_id, emitted=True, send_result={"sent": True},
-        )
-    return result
-
-
-# ===========================================================================
-# SCENARIO 1: Multi-turn untagged conversation
-# Real pattern: viewer tags once, then sends 3-4 follow-ups without tagging
-# ===========================================================================
-
-
-def test_multi_turn_untagged_conversation(monkeypatch):
-    """Viewer tags Roonie once, sends multiple follow-ups — all should evaluate."""
-    _stub_route(monkeypatch)
-    d = ProviderDirector()
-    env = Env(offline=False)
-
-    # Turn 1: @mention
-    r1 = _say(d, env, "e1", "@RoonieTheCat hey what's up tonight?", user="fraggy", mention=True)
-    assert r1.action == "RESPOND_PUBLIC"
-
-    # Turn 2: untagged follow-up
-    r2 = _say(d, env, "e2", "this track is fire btw", user="fraggy")
-    assert r2.action == "RESPOND_PUBLIC"
-    assert r2.trace["director"]["conversation_continuation"] is True
-
-    # Turn 3: another untagged follow-up
-    r3 = _say(d, env, "e3", "reminds me of that set from last week", user="fraggy")
-    assert r3.action == "RESPOND_PUBLIC"
-    assert r3.trace["director"]["conversation_continuation"] is True
-
-    # Turn 4: yet another
-    r4 = _say(d, env, "e4", "yeah the energy in here is unreal", user="fraggy")
-    assert r4.action == "RESPOND_PUBLIC"
-    assert r4.trace["director"]["conversation_continuation"] is True
-
-
-# ===========================================================================
-# SCENARIO 2: Viewer re-tags after continuation
-# Real pattern: viewer is in continuation, then explicitly @mentions again
-# ===========================================================================
-
-
-def test_retag_after_continuation_uses_addressed_not_continuation(monkeypatch):
-    """When a viewer re-tags Roonie mid-continuation, it's addressed, not continuation."""
-    _stub_route(monkeypatch)
-    d = ProviderDirector()
-    env = Env(offline=False)
-
-    # Initial @mention + response
-    _say(d, env, "e1", "@RoonieTheCat hey!", user="c0rcyra", mention=True)
-
-    # Untagged follow-up (continuation)
-    r2 = _say(d, env, "e2", "got a box for your loafing needs", user="c0rcyra")
-    assert r2.trace["director"]["conversation_continuation"] is True
-    assert r2.trace["director"]["addressed_to_roonie"] is False
-
-    # Re-tag (addressed, not continuation)
-    r3 = _say(d, env, "e3", "@RoonieTheCat what do you think of this tune?", user="c0rcyra", mention=True)
-    assert r3.trace["director"]["addressed_to_roonie"] is True
-    assert r3.trace["director"]["conversation_continuation"] is False
-    assert r3.action == "RESPOND_PUBLIC"
-
-
-# ===========================================================================
-# SCENARIO 3: Two viewers talking to Roonie at the same time
-# Real pattern: viewer_a tags Roonie, viewer_b also tags Roonie, then both
-# send untagged follow-ups — only the last-replied-to viewer gets continuation
-# ===========================================================================
-
-
-def test_two_viewers_tagging_only_last_gets_continuation(monkeypatch):
-    """Two viewers tag Roonie — only the last-replied-to viewer gets continuation."""
-    _stub_route(monkeypatch)
-    d = ProviderDirector()
-    env = Env(offline=False)
-
-    # viewer_a tags Roonie
-    _say(d, env, "e1", "@RoonieTheCat hey cat!", user="viewer_a", mention=True)
-
-    # viewer_b tags Roonie (Roonie responds to viewer_b last)
-    _say(d, env, "e2", "@RoonieTheCat what's playing?", user="viewer_b", mention=True)
-
-    # viewer_a untagged follow-up — should NOOP (Roonie's last reply was to viewer_b)
-    r3 = _say(d, env, "e3", "that box is comfy right", user="viewer_a", send=False)
-    assert r3.action == "NOOP"
-
-    # viewer_b untagged follow-up — should continue
-    r4 = _say(d, env, "e4", "oh nice I love this artist", user="viewer_b")
-    assert r4.action == "RESPOND_PUBLIC"
-    assert r4.trace["director"]["conversation_continuation"] is True
+def _canned_route(**kwargs):
+    kwargs["context"]["provider_selected"] = "openai"
+    kwargs["context"]["moderation_result"] = "allow"
+    return "sure thing"
 
 
-# ===========================================================================
-# SCENARIO 4: Bystander messages don't break continuation
-# Real pattern: viewer_a is talking to Roonie, random viewers chat among
-# themselves, viewer_a sends another follow-up — continuation should hold
-# ===========================================================================
-
-
-def test_bystander_chat_does_not_break_continuation(monkeypatch):
-    """Unrelated messages from other viewers don't disrupt active continuation."""
-    _stub_route(monkeypatch)
-    d = ProviderDirector()
-    env = Env(offline=False)
-
-    # viewer_a tags Roonie
-    _say(d, env, "e1", "@RoonieTheCat hey!", user="viewer_a", mention=True)
-
-    # Bystander noise (these NOOP and don't create roonie turns)
-    r_b1 = _say(d, env, "e2", "lol anyone see that goal earlier", user="bystander1", send=False)
-    assert r_b1.action == "NOOP"
-
-    r_b2 = _say(d, env, "e3", "yeah banger of a match", user="bystander2", send=False)
-    assert r_b2.action == "NOOP"
+@pytest.fixture(scope="module", autouse=True)
+def _stub_route_module():
+    """Stub route_generate with a canned reply once for the whole module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(_pd_mod, "route_generate", _canned_route)
+        yield
 
-    # viewer_a follow-up — Roonie's last reply was still to viewer_a
-    r4 = _say(d, env, "e4", "also what time do you guys stream", user="viewer_a")
-    assert r4.action == "RESPOND_PUBLIC"
-    assert r4.trace["director"]["conversation_continuation"] is True
 
+@pytest.fixture(scope="module")
+def _proto_clock() -> _FakeClock:
+    return _FakeClock()
 
-# ===========================================================================
-# SCENARIO 5: Viewer switches topic mid-continuation
-# Real pattern: viewer is chatting about music, then switches to asking
-# about the stream schedule — continuation should still work (topic switch
-# is fine as long as it's the same viewer)
-# ===========================================================================
-
-
-def test_topic_switch_mid_continuation_still_evaluates(monkeypatch):
-    """Topic switch mid-continuation still gets evaluated — LLM handles topic shift."""
-    _stub_route(monkeypatch)
-    d = ProviderDirector()
-    env = Env(offline=False)
-
-    # Music question
-    _say(d, env, "e1", "@RoonieTheCat what's this track called?", user="fraggy", mention=True)
-
-    # Topic switch to stream schedule (no tag)
-    r2 = _say(d, env, "e2", "when do you guys stream next", user="fraggy")
-    assert r2.action == "RESPOND_PUBLIC"
-    assert r2.trace["director"]["conversation_continuation"] is True
 
-    # Topic switch again to banter
-    r3 = _say(d, env, "e3", "this set is hitting different tonight honestly", user="fraggy")
-    assert r3.action == "RESPOND_PUBLIC"
-    assert r3.trace["director"]["conversation_continuation"] is True
+@pytest.fixture(scope="module")
+def _director_proto(_proto_clock) -> ProviderDirector:
+    return _new_director(_proto_clock)
 
 
-# ===========================================================================
-# SCENARIO 6: Conversation handoff between viewers
-# Real pattern: viewer_a chats with Roonie, then viewer_b tags Roonie,
-# Roonie responds to viewer_b, now viewer_b has continuation and viewer_a lost it
-# ===========================================================================
-
-
-def test_conversation_handoff_between_viewers(monkeypatch):
-    """When Roonie responds to a new viewer, the old viewer loses continuation."""
-    _stub_route(monkeypatch)
-    d = ProviderDirector()
-    env = Env(offline=False)
-
-    # viewer_a conversation
-    _say(d, env, "e1", "@RoonieTheCat hey!", user="viewer_a", mention=True)
-    r2 = _say(d, env, "e2", "what's good tonight", user="viewer_a")
-    assert r2.action == "RESPOND_PUBLIC"  # continuation works
-
-    # viewer_b tags Roonie — handoff
-    _say(d, env, "e3", "@RoonieTheCat when's the next stream?", user="viewer_b", mention=True)
-
-    # viewer_a lost continuation
-    r4 = _say(d, env, "e4", "that track was sick", user="viewer_a", send=False)
-    assert r4.action == "NOOP"
-
-    # viewer_b has continuation
-    r5 = _say(d, env, "e5", "cool I'll be there saturday", user="viewer_b")
-    assert r5.action == "RESPOND_PUBLIC"
-    assert r5.trace["director"]["conversation_continuation"] is True
-
-
-# ===========================================================================
-# SCENARIO 7: Viewer says "roonie" in message text (implicit address)
-# Real pattern: viewer doesn't @mention but says "roonie" somewhere in the msg
-# ===========================================================================
-
+@pytest.fixture
+def director(_director_proto, _proto_clock) -> ProviderDirector:
+    _director_proto.reset()
+    _proto_clock.ticks = 0
+    return _director_proto
 
-def test_roonie_in_text_is_addressed_not_continuation(monkeypatch):
-    """Message containing 'roonie' is addressed, even during active continuation."""
-    _stub_route(monkeypatch)
-    d = ProviderDirector()
-    env = Env(offline=False)
 
-    # Setup continuation
-    _say(d, env, "e1", "@RoonieTheCat hey!", user="viewer_a", mention=True)
-
-    # Viewer says "roonie" in text — this is addressed, not continuation
-    r2 = _say(d, env, "e2", "yo roonie what track is this", user="viewer_a")
-    assert r2.trace["director"]["addressed_to_roonie"] is True
-    assert r2.trace["director"]["conversation_continuation"] is False
-
-
-# ===========================================================================
-# SCENARIO 8: Rapid-fire chat — multiple unrelated viewers, only one tagged
-# Real pattern: busy chat moment, 5 messages fly by, only one tagged Roonie
-# ===========================================================================
-
-
-def test_rapid_fire_chat_only_tagged_viewer_gets_response(monkeypatch):
-    """In rapid chat, only the viewer who tagged Roonie gets a response."""
-    _stub_route(monkeypatch)
-    d = ProviderDirector()
-    env = Env(offline=False)
-
-    # Burst of unrelated chat
-    r1 = _say(d, env, "e1", "LFG this set is nuts", user="viewer_x", send=False)
-    r2 = _say(d, env, "e2", "anyone know the ID", user="viewer_y", send=False)
-    r3 = _say(d, env, "e3", "banger after banger", user="viewer_z", send=False)
-
-    assert r1.action == "NOOP"
-    assert r2.action == "NOOP"
-    assert r3.action == "NOOP"
-
-    # One viewer tags Roonie
-    r4 = _say(d, env, "e4", "@RoonieTheCat hey cat!", user="viewer_a", mention=True)
-    assert r4.action == "RESPOND_PUBLIC"
+def _say(director, event_id, message, *, user="c0rcyra", mention=False, send=True, metadata_extra=None):
+    """Helper: evaluate a message and optionally confirm send."""
+    e = _event(event_id, message, user=user, is_direct_mention=mention, metadata_extra=metadata_extra)
+    result = director.evaluate(e, ENV_LIVE)
+    if send and result.action == _RESPOND_PUBLIC:
+        director.apply_output_feedback(
+            event_id=event_id, emitted=True, send_result={"sent": True},
+        )
+    return result
 
-    # More noise
-    r5 = _say(d, env, "e5", "POGGERS", user="viewer_x", send=False)
-    assert r5.action == "NOOP"
 
-    # Tagged viewer follow-up
-    r6 = _say(d, env, "e6", "what's the track called", user="viewer_a")
-    assert r6.action == "RESPOND_PUBLIC"
-    assert r6.trace["director"]["conversation_continuation"] is True
+def _d(result) -> Dict[str, Any]:
+    """The director section of a decision trace."""
+    return result.trace["director"]
+
+
+def _assert_continues(result) -> None:
+    d = _d(result)
+    assert result.action == "RESPOND_PUBLIC", f"{result.event_id}: action={result.action!r}"
+    assert d["conversation_continuation"] is True, f"{result.event_id}: reason={d['continuation_reason']!r}"
+    assert d["addressed_to_roonie"] is False, f"{result.event_id}: unexpectedly addressed"
+
+
+def _assert_noop(result, *, reason: Optional[str] = None) -> None:
+    d = _d(result)
+    assert result.action == "NOOP", f"{result.event_id}: action={result.action!r}"
+    assert d["conversation_continuation"] is False, f"{result.event_id}: unexpected continuation"
+    if reason is not None:
+        assert d["continuation_reason"] == reason, f"{result.event_id}: reason={d['continuation_reason']!r}"
+
+
+@pytest.fixture(scope="module")
+def _primed_proto(_stub_route_module) -> ProviderDirector:
+    """A director that has already answered viewer_a's "@RoonieTheCat hey!" (event e1).
+
+    Its clock is deep-copied with it, so every primed_director starts from the same tick.
+    """
+    d = _new_director(_FakeClock())
+    _say(d, "e1", "@RoonieTheCat hey!", user="viewer_a", mention=True)
+    return d
+
+
+@pytest.fixture
+def primed_director(_primed_proto) -> ProviderDirector:
+    return copy.deepcopy(_primed_proto)
+
+
+@dataclass(frozen=True)
+class _Step:
+    """One chat message in a scenario plus what the director should decide.
+
+    ``expect`` keys are checked against ``result.trace["director"]``, except
+    ``"action"`` which is checked against ``result.action``.
+    """
+
+    event_id: str
+    message: str
+    user: str
+    mention: bool = False
+    send: bool = True
+    metadata_extra: Optional[Dict[str, Any]] = None
+    expect: Dict[str, Any] = field(default_factory=dict)
+
+
+_CONTINUES = {"action": "RESPOND_PUBLIC", "conversation_continuation": True}
+_ADDRESSED = {"addressed_to_roonie": True, "conversation_continuation": False}
+
+
+SCENARIOS: List[Tuple[str, List[_Step]]] = [
+    # SCENARIO 1: viewer tags once, then sends 3 follow-ups without tagging.
+    ("multi_turn_untagged_conversation", [
+        _Step("e1", "@RoonieTheCat hey what's up tonight?", "fraggy", mention=True,
+              expect={"action": "RESPOND_PUBLIC"}),
+        _Step("e2", "this track is fire btw", "fraggy", expect=_CONTINUES),
+        _Step("e3", "reminds me of that set from last week", "fraggy", expect=_CONTINUES),
+        _Step("e4", "yeah the energy in here is unreal", "fraggy", expect=_CONTINUES),
+    ]),
+    # SCENARIO 2: re-tagging mid-continuation is addressed, not continuation.
+    ("retag_after_continuation_uses_addressed_not_continuation", [
+        _Step("e1", "@RoonieTheCat hey!", "c0rcyra", mention=True),
+        _Step("e2", "got a box for your loafing needs", "c0rcyra",
+              expect={"conversation_continuation": True, "addressed_to_roonie": False}),
+        _Step("e3", "@RoonieTheCat what do you think of this tune?", "c0rcyra", mention=True,
+              expect={**_ADDRESSED, "action": "RESPOND_PUBLIC"}),
+    ]),
+    # SCENARIO 3: two viewers tag Roonie; only the last-replied-to one continues.
+    ("two_viewers_tagging_only_last_gets_continuation", [
+        _Step("e1", "@RoonieTheCat hey cat!", "viewer_a", mention=True),
+        _Step("e2", "@RoonieTheCat what's playing?", "viewer_b", mention=True),
+        _Step("e3", "that box is comfy right", "viewer_a", send=False, expect={"action": "NOOP"}),
+        _Step("e4", "oh nice I love this artist", "viewer_b", expect=_CONTINUES),
+    ]),
+    # SCENARIO 4: bystanders chatting among themselves don't break continuation.
+    ("bystander_chat_does_not_break_continuation", [
+        _Step("e1", "@RoonieTheCat hey!", "viewer_a", mention=True),
+        _Step("e2", "lol anyone see that goal earlier", "bystander1", send=False, expect={"action": "NOOP"}),
+        _Step("e3", "yeah banger of a match", "bystander2", send=False, expect={"action": "NOOP"}),
+        _Step("e4", "also what time do you guys stream", "viewer_a", expect=_CONTINUES),
+    ]),
+    # SCENARIO 5: a topic switch by the same viewer still continues.
+    ("topic_switch_mid_continuation_still_evaluates", [
+        _Step("e1", "@RoonieTheCat what's this track called?", "fraggy", mention=True),
+        _Step("e2", "when do you guys stream next", "fraggy", expect=_CONTINUES),
+        _Step("e3", "this set is hitting different tonight honestly", "fraggy", expect=_CONTINUES),
+    ]),
+    # SCENARIO 6: Roonie replying to a new viewer hands the thread over.
+    ("conversation_handoff_between_viewers", [
+        _Step("e1", "@RoonieTheCat hey!", "viewer_a", mention=True),
+        _Step("e2", "what's good tonight", "viewer_a", expect={"action": "RESPOND_PUBLIC"}),
+        _Step("e3", "@RoonieTheCat when's the next stream?", "viewer_b", mention=True),
+        _Step("e4", "that track was sick", "viewer_a", send=False, expect={"action": "NOOP"}),
+        _Step("e5", "cool I'll be there saturday", "viewer_b", expect=_CONTINUES),
+    ]),
+    # SCENARIO 7: saying "roonie" in the text is addressed, not continuation.
+    ("roonie_in_text_is_addressed_not_continuation", [
+        _Step("e1", "@RoonieTheCat hey!", "viewer_a", mention=True),
+        _Step("e2", "yo roonie what track is this", "viewer_a", expect=_ADDRESSED),
+    ]),
+    # SCENARIO 8: busy chat where only one viewer tagged Roonie.
+    ("rapid_fire_chat_only_tagged_viewer_gets_response", [
+        _Step("e1", "LFG this set is nuts", "viewer_x", send=False, expect={"action": "NOOP"}),
+        _Step("e2", "anyone know the ID", "viewer_y", send=False, expect={"action": "NOOP"}),
+        _Step("e3", "banger after banger", "viewer_z", send=False, expect={"action": "NOOP"}),
+        _Step("e4", "@RoonieTheCat hey cat!", "viewer_a", mention=True, expect={"action": "RESPOND_PUBLIC"}),
+        _Step("e5", "POGGERS", "viewer_x", send=False, expect={"action": "NOOP"}),
+        _Step("e6", "what's the track called", "viewer_a", expect=_CONTINUES),
+    ]),
+    # SCENARIO 10: a third-person "roonie" from another viewer doesn't steal the thread.
+    ("other_viewer_mentions_roonie_does_not_steal_conversation", [
+        _Step("e1", "@RoonieTheCat hey!", "viewer_a", mention=True),
+        _Step("e2", "haha roonie is such a vibe", "viewer_b",
+              expect={"addressed_to_roonie": False, "action": "NOOP"}),
+        _Step("e3", "yeah the vibes are real", "viewer_a", send=False, expect=_CONTINUES),
+    ]),
+    # SCENARIO 15: viewers alternate tagging; every message is addressed.
+    ("alternating_tagged_viewers", [
+        _Step("e1", "@RoonieTheCat hey!", "viewer_a", mention=True, expect=_ADDRESSED),
+        _Step("e2", "@RoonieTheCat what's playing?", "viewer_b", mention=True, expect=_ADDRESSED),
+        _Step("e3", "@RoonieTheCat nice one cat", "viewer_a", mention=True, expect=_ADDRESSED),
+    ]),
+    # SCENARIO 17: an addressed OTHER-category statement with no trigger is never
+    # flagged as continuation, even with a thread already open.
+    ("addressed_no_trigger_noops_even_with_prior_continuation", [
+        _Step("e1", "@RoonieTheCat hey!", "viewer_a", mention=True),
+        _Step("e2", "@RoonieTheCat yeah the vibes tonight are absolutely incredible", "viewer_a",
+              mention=True, send=False, expect={"conversation_continuation": False}),
+    ]),
+    # SCENARIO 18: exact recreation of the live bug that motivated continuation.
+    ("c0rcyra_cardboard_box_scenario", [
+        _Step("e1", "@RoonieTheCat come hang out with me", "c0rcyra", mention=True),
+        _Step("e2", "I also have a cardboard box for all your loafing needs ruleof6Lovecat", "c0rcyra",
+              expect={**_CONTINUES, "addressed_to_roonie": False}),
+    ]),
+    # SCENARIO 19: the same viewer greets someone else by name.
+    ("greeting_named_other_blocks_continuation", [
+        _Step("e1", "@RoonieTheCat what's the vibe tonight?", "cland3stine", mention=True),
+        _Step("e2", "Hey Jack! Its so good to see you!", "cland3stine", send=False,
+              expect={"action": "NOOP", "conversation_continuation": False,
+                      "continuation_reason": "GREETING_OTHER_USER"}),
+    ]),
+    # SCENARIO 20: the same viewer @mentions someone else.
+    ("third_party_mention_blocks_continuation", [
+        _Step("e1", "@RoonieTheCat track id please?", "cland3stine", mention=True),
+        _Step("e2", "Hey hey @umbrellaflyer - how you doing?", "cland3stine", send=False,
+              expect={"action": "NOOP", "conversation_continuation": False,
+                      "continuation_reason": "MENTION_OTHER_USER"}),
+    ]),
+    # SCENARIO 21: a Twitch reply whose parent is someone else.
+    ("reply_parent_other_blocks_continuation", [
+        _Step("e1", "@RoonieTheCat are you AI?", "cland3stine", mention=True),
+        _Step("e2", "what do you think?", "cland3stine", send=False,
+              metadata_extra={"reply_parent_user_login": "some_other_user"},
+              expect={"action": "NOOP", "conversation_continuation": False,
+                      "continuation_reason": "REPLY_PARENT_OTHER"}),
+    ]),
+    # SCENARIO 22: a multi-mention social message that includes Roonie is addressed.
+    ("multimention_direct_message_still_addressed", [
+        _Step("e1",
+              "Hey Jack! Good to see you! By the way, looks like @RuleOfRune got their plushie cat "
+              "@RoonieTheCat talking in chat...he's so cool!",
+              "viewer_a", send=False, expect={**_ADDRESSED, "action": "RESPOND_PUBLIC"}),
+    ]),
+    # SCENARIO 23: a third-person Roonie reference doesn't steal the thread.
+    ("third_person_roonie_reference_does_not_steal_continuation", [
+        _Step("e1", "yo Roonie!", "viewer_a"),
+        _Step("e2", "How's your new laptop by the way?", "viewer_a", expect=_CONTINUES),
+        _Step("e3", "it's the perfect laptop for Roonie, I'm so glad he loves it already", "viewer_b",
+              send=False, expect={"addressed_to_roonie": False, "action": "NOOP"}),
+        _Step("e4", "Roonie how's typing on it by the way?", "viewer_a",
+              expect={"action": "RESPOND_PUBLIC", "addressed_to_roonie": True}),
+    ]),
+    # SCENARIO 24: a possessive Roonie mention aimed at @someone_else isn't direct.
+    ("possessive_roonie_with_other_mention_noops", [
+        _Step("e1", "yo Roonie!", "viewer_a"),
+        _Step("e2", "@lilhjohny check out Roonie's laptop!", "viewer_a", send=False,
+              expect={"addressed_to_roonie": False, "action": "NOOP"}),
+    ]),
+    # SCENARIO 25: the same viewer targets another person by name.
+    ("targeting_art_by_name_blocks_continuation", [
+        _Step("e1", "@RoonieTheCat you good?", "c0rcyra", mention=True),
+        _Step("e2", "man work was crazy today", "c0rcyra"),
+        _Step("e3", "so what else is good, art? how are things your way?", "c0rcyra", send=False,
+              expect={"action": "NOOP", "addressed_to_roonie": False,
+                      "conversation_continuation": False,
+                      "continuation_reason": "TARGETING_OTHER_NAME"}),
+    ]),
+]
+
+
+@pytest.mark.parametrize("scenario", SCENARIOS, ids=lambda s: s[0])
+def test_scenario(director, scenario):
+    name, steps = scenario
+    for step in steps:
+        r = _say(
+            director,
+            step.event_id,
+            step.message,
+            user=step.user,
+            mention=step.mention,
+            send=step.send,
+            metadata_extra=step.metadata_extra,
+        )
+        trace = _d(r)
+        for key, expected in step.expect.items():
+            actual = r.action if key == "action" else trace[key]
+            message = f"{name}/{step.event_id}: {key}={actual!r}, expected {expected!r}"
+            if isinstance(expected, bool):
+                assert actual is expected, message
+            else:
+                assert actual == expected, message
 
 
 # ===========================================================================
@@ -302,57 +342,19 @@ def test_rapid_fire_chat_only_tagged_viewer_gets_response(monkeypatch):
 # ===========================================================================
 
 
-def test_session_reset_clears_continuation(monkeypatch):
+def test_session_reset_clears_continuation(primed_director):
     """New session_id wipes context buffer, ending any active continuation."""
-    _stub_route(monkeypatch)
-    d = ProviderDirector()
-    env = Env(offline=False)
-
-    # Establish continuation
-    _say(d, env, "e1", "@RoonieTheCat hey!", user="viewer_a", mention=True)
+    # viewer_a has tagged Roonie and been answered (primed_director seed).
 
     # New session
-    new_session_event = Event(
-        event_id="e2",
-        message="what's good tonight",
-        metadata={
-            "user": "viewer_a",
-            "is_direct_mention": False,
-            "mode": "live",
-            "platform": "twitch",
-            "session_id": "different-session",
-        },
+    new_session_event = _event(
+        "e2",
+        "what's good tonight",
+        user="viewer_a",
+        metadata_extra={"session_id": "different-session"},
     )
-    r2 = d.evaluate(new_session_event, env)
-    assert r2.action == "NOOP"
-
-
-# ===========================================================================
-# SCENARIO 10: Continuation with "roonie" mention by OTHER viewer
-# Real pattern: viewer_a is chatting with Roonie, viewer_b says "roonie is
-# a cool cat" — viewer_b's message is a third-person reference, not direct address.
-# It should not steal viewer_a's continuation.
-# ===========================================================================
-
-
-def test_other_viewer_mentions_roonie_does_not_steal_conversation(monkeypatch):
-    """Third-person 'roonie' references should not trigger a handoff."""
-    _stub_route(monkeypatch)
-    d = ProviderDirector()
-    env = Env(offline=False)
-
-    # viewer_a starts conversation
-    _say(d, env, "e1", "@RoonieTheCat hey!", user="viewer_a", mention=True)
-
-    # viewer_b mentions roonie in third person (not addressed)
-    r2 = _say(d, env, "e2", "haha roonie is such a vibe", user="viewer_b")
-    assert r2.trace["director"]["addressed_to_roonie"] is False
-    assert r2.action == "NOOP"
-
-    # viewer_a should still retain continuation
-    r3 = _say(d, env, "e3", "yeah the vibes are real", user="viewer_a", send=False)
-    assert r3.action == "RESPOND_PUBLIC"
-    assert r3.trace["director"]["conversation_continuation"] is True
+    r2 = primed_director.evaluate(new_session_event, ENV_LIVE)
+    _assert_noop(r2)
 
 
 # ===========================================================================
@@ -362,25 +364,19 @@ def test_other_viewer_mentions_roonie_does_not_steal_conversation(monkeypatch):
 # ===========================================================================
 
 
-def test_continuation_survives_if_interrupter_response_not_sent(monkeypatch):
+def test_continuation_survives_if_interrupter_response_not_sent(primed_director):
     """If Roonie's response to an interrupter isn't sent, original continuation holds."""
-    _stub_route(monkeypatch)
-    d = ProviderDirector()
-    env = Env(offline=False)
-
-    # viewer_a starts conversation
-    _say(d, env, "e1", "@RoonieTheCat hey!", user="viewer_a", mention=True)
+    # viewer_a has tagged Roonie and been answered (primed_director seed).
 
     # viewer_b tags Roonie, but response is NOT sent (suppressed)
-    r2 = _say(d, env, "e2", "@RoonieTheCat yo!", user="viewer_b", mention=True, send=False)
+    r2 = _say(primed_director, "e2", "@RoonieTheCat yo!", user="viewer_b", mention=True, send=False)
     assert r2.action == "RESPOND_PUBLIC"
     # Don't confirm send — simulate output gate suppression
-    d.apply_output_feedback(event_id="e2", emitted=False, send_result={"sent": False})
+    primed_director.apply_output_feedback(event_id="e2", emitted=False, send_result={"sent": False})
 
     # viewer_a's continuation should still work — last SENT roonie turn was to viewer_a
-    r3 = _say(d, env, "e3", "what time is the set ending tonight", user="viewer_a")
-    assert r3.action == "RESPOND_PUBLIC"
-    assert r3.trace["director"]["conversation_continuation"] is True
+    r3 = _say(primed_director, "e3", "what time is the set ending tonight", user="viewer_a")
+    _assert_continues(r3)
 
 
 # ===========================================================================
@@ -390,20 +386,14 @@ def test_continuation_survives_if_interrupter_response_not_sent(monkeypatch):
 # ===========================================================================
 
 
-def test_continuation_messages_accumulate_in_context(monkeypatch):
+def test_continuation_messages_accumulate_in_context(primed_director):
     """Multiple continuation messages are all stored in context buffer."""
-    _stub_route(monkeypatch)
-    d = ProviderDirector()
-    env = Env(offline=False)
+    # viewer_a has tagged Roonie and been answered (primed_director seed).
+    _say(primed_director, "e2", "this set is incredible", user="viewer_a")
+    _say(primed_director, "e3", "like actually one of the best", user="viewer_a")
+    _say(primed_director, "e4", "been here since the start and it keeps getting better", user="viewer_a")
 
-    _say(d, env, "e1", "@RoonieTheCat hey!", user="viewer_a", mention=True)
-
-    _say(d, env, "e2", "this set is incredible", user="viewer_a")
-    _say(d, env, "e3", "like actually one of the best", user="viewer_a")
-    _say(d, env, "e4", "been here since the start and it keeps getting better", user="viewer_a")
-
-    turns = d.context_buffer.get_context(max_turns=12)
-    viewer_a_turns = [t for t in turns if t.speaker == "user" and t.tags.get("user") == "viewer_a"]
+    viewer_a_turns = primed_director.context_buffer.get_user_turns("viewer_a")
     # Should have all 4 user turns (1 addressed + 3 continuations)
     assert len(viewer_a_turns) == 4
     # First should have direct_address=True, rest should have continuation=True
@@ -417,29 +407,13 @@ def test_continuation_messages_accumulate_in_context(monkeypatch):
 # ===========================================================================
 
 
-def test_empty_username_no_continuation(monkeypatch):
+def test_empty_username_no_continuation(primed_director):
     """Events with empty username never trigger continuation."""
-    _stub_route(monkeypatch)
-    d = ProviderDirector()
-    env = Env(offline=False)
-
-    _say(d, env, "e1", "@RoonieTheCat hey!", user="viewer_a", mention=True)
-
+    # viewer_a has tagged Roonie and been answered (primed_director seed).
     # Empty username event
-    empty_user_event = Event(
-        event_id="e2",
-        message="hello again",
-        metadata={
-            "user": "",
-            "is_direct_mention": False,
-            "mode": "live",
-            "platform": "twitch",
-            "session_id": SESSION,
-        },
-    )
-    r = d.evaluate(empty_user_event, env)
-    assert r.action == "NOOP"
-    assert r.trace["director"]["conversation_continuation"] is False
+    empty_user_event = _event("e2", "hello again", user="")
+    r = primed_director.evaluate(empty_user_event, ENV_LIVE)
+    _assert_noop(r, reason="EMPTY_USER")
 
 
 # ===========================================================================
@@ -448,56 +422,15 @@ def test_empty_username_no_continuation(monkeypatch):
 # ===========================================================================
 
 
-def test_username_matching_is_case_insensitive(monkeypatch):
+def test_username_matching_is_case_insensitive(director):
     """Continuation detects same viewer regardless of username case."""
-    _stub_route(monkeypatch)
-    d = ProviderDirector()
-    env = Env(offline=False)
-
     # Initial tag with mixed case
-    _say(d, env, "e1", "@RoonieTheCat hey!", user="Fraggy", mention=True)
+    _say(director, "e1", "@RoonieTheCat hey!", user="Fraggy", mention=True)
 
     # Follow-up with different case
-    e2 = Event(
-        event_id="e2",
-        message="this track tho",
-        metadata={
-            "user": "fraggy",
-            "is_direct_mention": False,
-            "mode": "live",
-            "platform": "twitch",
-            "session_id": SESSION,
-        },
-    )
-    r2 = d.evaluate(e2, env)
-    assert r2.action == "RESPOND_PUBLIC"
-    assert r2.trace["director"]["conversation_continuation"] is True
-
-
-# ===========================================================================
-# SCENARIO 15: Ping-pong — two viewers take turns tagging Roonie
-# Real pattern: viewer_a and viewer_b alternate tagging, each should work
-# as addressed (not continuation)
-# ===========================================================================
-
-
-def test_alternating_tagged_viewers(monkeypatch):
-    """Two viewers alternate tagging Roonie — all are addressed, none are continuation."""
-    _stub_route(monkeypatch)
-    d = ProviderDirector()
-    env = Env(offline=False)
-
-    r1 = _say(d, env, "e1", "@RoonieTheCat hey!", user="viewer_a", mention=True)
-    assert r1.trace["director"]["addressed_to_roonie"] is True
-    assert r1.trace["director"]["conversation_continuation"] is False
-
-    r2 = _say(d, env, "e2", "@RoonieTheCat what's playing?", user="viewer_b", mention=True)
-    assert r2.trace["director"]["addressed_to_roonie"] is True
-    assert r2.trace["director"]["conversation_continuation"] is False
-
-    r3 = _say(d, env, "e3", "@RoonieTheCat nice one cat", user="viewer_a", mention=True)
-    assert r3.trace["director"]["addressed_to_roonie"] is True
-    assert r3.trace["director"]["conversation_continuation"] is False
+    e2 = _event("e2", "this track tho", user="fraggy")
+    r2 = director.evaluate(e2, ENV_LIVE)
+    _assert_continues(r2)
 
 
 # ===========================================================================
@@ -507,240 +440,30 @@ def test_alternating_tagged_viewers(monkeypatch):
 # ===========================================================================
 
 
-def test_continuation_expires_when_buffer_fills(monkeypatch):
+def test_continuation_expires_when_buffer_fills(primed_director):
     """Continuation expires when enough turns push the roonie turn out of the buffer."""
-    _stub_route(monkeypatch)
-    d = ProviderDirector()
-    env = Env(offline=False)
-
-    # Initial conversation
-    _say(d, env, "e1", "@RoonieTheCat hey!", user="viewer_a", mention=True)
-
-    # Flood the buffer with OTHER viewers tagging Roonie
-    # Context buffer is 12 turns. Each exchange is 2 turns (user + roonie).
-    # After 6 exchanges with different viewers, the original roonie turn
-    # should be pushed out.
-    for i in range(7):
-        _say(d, env, f"flood-{i}", f"@RoonieTheCat message {i}", user=f"flood_viewer_{i}", mention=True)
-
-    # Original viewer returns — continuation should be gone
-    r = _say(d, env, "e-return", "hey still here", user="viewer_a", send=False)
-    assert r.action == "NOOP"
-    assert r.trace["director"]["conversation_continuation"] is False
-
-
-# ===========================================================================
-# SCENARIO 17: Addressed + trigger vs addressed + no trigger during continuation
-# Real pattern: "OTHER" category message with @mention but no trigger
-# (no ?, no verb, >3 chars). This tests the trigger gate interaction.
-# ===========================================================================
-
-
-def test_addressed_no_trigger_noops_even_with_prior_continuation(monkeypatch):
-    """Addressed OTHER-category message without trigger still NOOPs —
-    continuation flag is False because message is addressed."""
-    _stub_route(monkeypatch)
-    d = ProviderDirector()
-    env = Env(offline=False)
-
-    # Setup continuation
-    _say(d, env, "e1", "@RoonieTheCat hey!", user="viewer_a", mention=True)
-
-    # Addressed but no trigger (OTHER category, no ?, no direct verb, > 3 chars)
-    r2 = _say(d, env, "e2", "@RoonieTheCat yeah the vibes tonight are absolutely incredible", user="viewer_a", mention=True, send=False)
-    # addressed=True + trigger=False + category=OTHER → NOOP
-    # (continuation is False because addressed=True)
-    # BUT: this will go through short_ack_preferred path since it's addressed + OTHER + long statement
-    # Let's check what actually happens
-    # The key point: addressed=True means continuation=False (by design)
-    assert r2.trace["director"]["conversation_continuation"] is False
-
-
-# ===========================================================================
-# SCENARIO 18: The c0rcyra cardboard box scenario (the original bug)
-# Exact recreation of the live testing failure that motivated this feature
-# ===========================================================================
-
-
-def test_c0rcyra_cardboard_box_scenario(monkeypatch):
-    """Exact recreation of the bug: c0rcyra chatting with Roonie, sends
-    'I also have a cardboard box for all your loafing needs ruleof6Lovecat'
-    without tagging — should NOT noop."""
-    _stub_route(monkeypatch)
-    d = ProviderDirector()
-    env = Env(offline=False)
-
-    # c0rcyra and Roonie are chatting
-    _say(d, env, "e1", "@RoonieTheCat come hang out with me", user="c0rcyra", mention=True)
-
-    # c0rcyra follow-up without tag (the original bug)
-    r2 = _say(d, env, "e2",
-              "I also have a cardboard box for all your loafing needs ruleof6Lovecat",
-              user="c0rcyra")
-    assert r2.action == "RESPOND_PUBLIC"
-    assert r2.trace["director"]["conversation_continuation"] is True
-    assert r2.trace["director"]["addressed_to_roonie"] is False
-
-
-# ===========================================================================
-# SCENARIO 19: Same viewer greets someone else — continuation should not butt in
-# ===========================================================================
-
-
-def test_greeting_named_other_blocks_continuation(monkeypatch):
-    _stub_route(monkeypatch)
-    d = ProviderDirector()
-    env = Env(offline=False)
-
-    _say(d, env, "e1", "@RoonieTheCat what's the vibe tonight?", user="cland3stine", mention=True)
-    r2 = _say(d, env, "e2", "Hey Jack! Its so good to see you!", user="cland3stine", send=False)
-
-    assert r2.action == "NOOP"
-    assert r2.trace["director"]["conversation_continuation"] is False
-    assert r2.trace["director"]["continuation_reason"] == "GREETING_OTHER_USER"
-
-
-# ===========================================================================
-# SCENARIO 20: Same viewer @mentions someone else — continuation should no-op
-# ===========================================================================
-
-
-def test_third_party_mention_blocks_continuation(monkeypatch):
-    _stub_route(monkeypatch)
-    d = ProviderDirector()
-    env = Env(offline=False)
-
-    _say(d, env, "e1", "@RoonieTheCat track id please?", user="cland3stine", mention=True)
-    r2 = _say(d, env, "e2", "Hey hey @umbrellaflyer - how you doing?", user="cland3stine", send=False)
-
-    assert r2.action == "NOOP"
-    assert r2.trace["director"]["conversation_continuation"] is False
-    assert r2.trace["director"]["continuation_reason"] == "MENTION_OTHER_USER"
-
-
-# ===========================================================================
-# SCENARIO 21: Twitch reply-parent targets someone else — continuation should no-op
-# ===========================================================================
-
-
-def test_reply_parent_other_blocks_continuation(monkeypatch):
-    _stub_route(monkeypatch)
-    d = ProviderDirector()
-    env = Env(offline=False)
-
-    _say(d, env, "e1", "@RoonieTheCat are you AI?", user="cland3stine", mention=True)
-    r2 = _say(
-        d,
-        env,
-        "e2",
-        "what do you think?",
-        user="cland3stine",
-        send=False,
-        metadata_extra={"reply_parent_user_login": "some_other_user"},
-    )
-
-    assert r2.action == "NOOP"
-    assert r2.trace["director"]["conversation_continuation"] is False
-    assert r2.trace["director"]["continuation_reason"] == "REPLY_PARENT_OTHER"
-
-
-# ===========================================================================
-# SCENARIO 22: Multi-mention direct social message should still be addressable
-# ===========================================================================
-
-
-def test_multimention_direct_message_still_addressed(monkeypatch):
-    _stub_route(monkeypatch)
-    d = ProviderDirector()
-    env = Env(offline=False)
-
-    r = _say(
-        d,
-        env,
-        "e1",
-        "Hey Jack! Good to see you! By the way, looks like @RuleOfRune got their plushie cat @RoonieTheCat talking in chat...he's so cool!",
-        user="viewer_a",
-        mention=False,
-        send=False,
-    )
-
-    assert r.trace["director"]["addressed_to_roonie"] is True
-    assert r.trace["director"]["conversation_continuation"] is False
-    assert r.action == "RESPOND_PUBLIC"
-
-
-# ===========================================================================
-# SCENARIO 23: Third-person Roonie mention should not steal thread handoff
-# ===========================================================================
-
-
-def test_third_person_roonie_reference_does_not_steal_continuation(monkeypatch):
-    _stub_route(monkeypatch)
-    d = ProviderDirector()
-    env = Env(offline=False)
-
-    # viewer_a starts thread
-    _say(d, env, "e1", "yo Roonie!", user="viewer_a", mention=False)
-    r2 = _say(d, env, "e2", "How's your new laptop by the way?", user="viewer_a")
-    assert r2.action == "RESPOND_PUBLIC"
-    assert r2.trace["director"]["conversation_continuation"] is True
-
-    # viewer_b talks ABOUT Roonie in third person (not to Roonie)
-    r3 = _say(
-        d,
-        env,
-        "e3",
-        "it's the perfect laptop for Roonie, I'm so glad he loves it already",
-        user="viewer_b",
-        send=False,
-    )
-    assert r3.trace["director"]["addressed_to_roonie"] is False
-    assert r3.action == "NOOP"
-
-    # viewer_a should still have continuation (no thread steal happened)
-    r4 = _say(d, env, "e4", "Roonie how's typing on it by the way?", user="viewer_a")
-    assert r4.action == "RESPOND_PUBLIC"
-    assert r4.trace["director"]["addressed_to_roonie"] is True
-
-
-# ===========================================================================
-# SCENARIO 24: Possessive mention + @other should not be treated as direct
-# ===========================================================================
-
-
-def test_possessive_roonie_with_other_mention_noops(monkeypatch):
-    _stub_route(monkeypatch)
-    d = ProviderDirector()
-    env = Env(offline=False)
-
-    _say(d, env, "e1", "yo Roonie!", user="viewer_a", mention=False)
-    r2 = _say(
-        d,
-        env,
-        "e2",
-        "@lilhjohny check out Roonie's laptop!",
-        user="viewer_a",
-        send=False,
+    # viewer_a has tagged Roonie and been answered (primed_director seed).
+
+    # Flood the buffer with OTHER viewers' tagged exchanges. Context buffer is
+    # 12 turns; each exchange is 2 turns (user + roonie), so 7 exchanges push
+    # the original roonie turn out. The turns are written straight into the
+    # buffer: the invariant under test is eviction, not how they were produced.
+    primed_director.context_buffer.bulk_add(
+        turn
+        for i in range(7)
+        for turn in (
+            ContextTurn(
+                ts=_FLOOD_TS,
+                speaker="user",
+                text=f"@RoonieTheCat message {i}",
+                tags={"direct_address": True, "user": f"flood_viewer_{i}"},
+            ),
+            ContextTurn(ts=_FLOOD_TS, speaker="roonie", text="sure thing"),
+        )
     )
-    assert r2.trace["director"]["addressed_to_roonie"] is False
-    assert r2.action == "NOOP"
-
+    assert primed_director.context_buffer.get_user_turns("viewer_a") == []
 
-# ===========================================================================
-# SCENARIO 25: Named other-person targeting should block continuation
-# ===========================================================================
-
-
-def test_targeting_art_by_name_blocks_continuation(monkeypatch):
-    _stub_route(monkeypatch)
-    d = ProviderDirector()
-    env = Env(offline=False)
-
-    _say(d, env, "e1", "@RoonieTheCat you good?", user="c0rcyra", mention=True)
-    _say(d, env, "e2", "man work was crazy today", user="c0rcyra")
-    r3 = _say(d, env, "e3", "so what else is good, art? how are things your way?", user="c0rcyra", send=False)
+    # Original viewer returns — continuation should be gone
+    r = _say(primed_director, "e-return", "hey still here", user="viewer_a", send=False)
+    _assert_noop(r)
 
-    assert r3.action == "NOOP"
-    assert r3.trace["director"]["addressed_to_roonie"] is False
-    assert r3.trace["director"]["conversation_continuation"] is False
-    assert r3.trace["director"]["continuation_reason"] == "TARGETING_OTHER_NAME"
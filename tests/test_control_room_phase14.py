@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import copy
 import json
 import os
+import re
 import socket
 import threading
 import sys
@@ -11,6 +13,9 @@ from pathlib import Path
 from typing import Any, Dict
 from urllib.parse import urlparse
 
+import pytest
+
+import conftest
 from roonie.control_room.preflight import resolve_runtime_paths, run_preflight
 from roonie.dashboard_api.app import _arg_parser as _dashboard_api_arg_parser
 from roonie.dashboard_api.app import create_server
@@ -33,15 +38,23 @@ def _get_json(base: str, path: str) -> Dict[str, Any]:
         headers=headers,
     )
     with urllib.request.urlopen(request, timeout=2.0) as response:
-        return json.loads(response.read().decode("utf-8"))
+        raw = response.read()
+    return conftest._json_loads(raw)
 
 
-def _start_server(runs_dir: Path, readiness_state: Dict[str, Any]):
+def _start_server(runs_dir: Path, readiness_state: Dict[str, Any], *, data_dir: Path, logs_dir: Path):
     os.environ.setdefault("ROONIE_DASHBOARD_ART_PASSWORD", "art-pass-123")
     os.environ.setdefault("ROONIE_DASHBOARD_JEN_PASSWORD", "jen-pass-123")
     _SESSION_COOKIE_CACHE.clear()
-    server = create_server(host="127.0.0.1", port=0, runs_dir=runs_dir, readiness_state=readiness_state)
-    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.1}, daemon=True)
+    server = create_server(
+        host="127.0.0.1",
+        port=0,
+        runs_dir=runs_dir,
+        readiness_state=readiness_state,
+        data_dir=data_dir,
+        logs_dir=logs_dir,
+    )
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.02}, daemon=True)
     thread.start()
     return server, thread
 
@@ -62,7 +75,8 @@ def _login_cookie(base: str) -> str:
     cached = _SESSION_COOKIE_CACHE.get(base)
     if cached:
         return cached
-    payload = json.dumps({"username": "jen", "password": "jen-pass-123"}).encode("utf-8")
+    creds = {"username": "jen", "password": "jen-pass-123"}
+    payload = conftest._json_dumps(creds)
     request = urllib.request.Request(
         f"{base}/api/auth/login",
         data=payload,
@@ -87,24 +101,108 @@ def _with_auto_cookie(base: str, path: str) -> Dict[str, str]:
     return {"Cookie": cookie} if cookie else {}
 
 
-def _write_persona_policy(path: Path, content: str) -> None:
+_PERSONA_POLICY_SENSES_OFF = b"version: 1\npersona: roonie\nsenses:\n  enabled: false\n"
+
+
+def _write_persona_policy(path: Path, content: bytes = _PERSONA_POLICY_SENSES_OFF) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content, encoding="utf-8")
+    path.write_bytes(content)
+
+
+_MANAGED_ENV = frozenset(
+    {
+        "ROONIE_DASHBOARD_DATA_DIR",
+        "ROONIE_DASHBOARD_LOGS_DIR",
+        "ROONIE_DASHBOARD_RUNS_DIR",
+        "ROONIE_PROVIDERS_CONFIG_PATH",
+        "ROONIE_ROUTING_CONFIG_PATH",
+    }
+)
+
+
+@pytest.fixture(autouse=True)
+def _scrub_runtime_path_env(monkeypatch) -> None:
+    """Start every test without runtime path overrides leaking in from the shell."""
+    for name in _MANAGED_ENV:
+        # Record the var even when unset so writes made by preflight are undone too.
+        monkeypatch.setenv(name, "")
+        monkeypatch.delenv(name)
+
+
+_READY_STATE: Dict[str, Any] = {
+    "ready": True,
+    "checked_at": "2026-02-13T00:00:00+00:00",
+    "items": [{"name": "preflight", "ok": True, "detail": "ok"}],
+    "blocking_reasons": [],
+}
+
+
+# Env vars DashboardStorage rewrites whenever it syncs control state.
+_STORAGE_SYNCED_ENV = (
+    "ROONIE_ARMED",
+    "ROONIE_ARM",
+    "ROONIE_OUTPUT_DISABLED",
+    "TWITCH_OUTPUT_ENABLED",
+    "ROONIE_ACTIVE_DIRECTOR",
+    "ROONIE_KILL_SWITCH",
+    "ROONIE_DRY_RUN",
+)
+
+
+def _restore_env(saved: Dict[str, Any]) -> None:
+    for name, value in saved.items():
+        if value is None:
+            os.environ.pop(name, None)
+        else:
+            os.environ[name] = value
+
+
+@pytest.fixture(scope="module")
+def _shared_dashboard_server(tmp_path_factory):
+    """One dashboard server per module, plus the control state it was seeded with."""
+    root = tmp_path_factory.mktemp("control_room_server")
+    runs_dir = root / "runs"
+    runs_dir.mkdir(parents=True, exist_ok=True)
+    saved_env = {name: os.environ.get(name) for name in _STORAGE_SYNCED_ENV}
+    with pytest.MonkeyPatch.context() as mp:
+        # Syncing control state during construction reads the provider router's config.
+        mp.setenv("ROONIE_DASHBOARD_DATA_DIR", str(root / "data"))
+        server, thread = _start_server(runs_dir, _READY_STATE, data_dir=root / "data", logs_dir=root / "logs")
+    # Construction syncs control state into os.environ; keep that out of other tests.
+    _restore_env(saved_env)
+    seeded_control = copy.deepcopy(getattr(server, "_roonie_storage")._control_state)
+    try:
+        yield server, f"http://127.0.0.1:{server.server_address[1]}", seeded_control
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join(timeout=0.5)
+
+
+@pytest.fixture
+def dashboard_server(_shared_dashboard_server, monkeypatch):
+    """The shared server, reset to its seeded control and readiness state for one test."""
+    server, base, seeded_control = _shared_dashboard_server
+    saved_env = {name: os.environ.get(name) for name in _STORAGE_SYNCED_ENV}
+    storage = getattr(server, "_roonie_storage")
+    monkeypatch.setenv("ROONIE_KILL_SWITCH", "0")
+    monkeypatch.setenv("ROONIE_ENFORCE_SETUP_GATE", "0")
+    # Provider routes resolve their config files from this on every request.
+    monkeypatch.setenv("ROONIE_DASHBOARD_DATA_DIR", str(storage.data_dir))
+    with storage._lock:
+        storage._control_state = copy.deepcopy(seeded_control)
+        storage._save_control_state_locked()
+        storage._sync_env_from_state_locked()
+    storage.set_readiness_state(_READY_STATE)
+    yield server, base
+    _restore_env(saved_env)
 
 
 def test_preflight_passes_and_seeds_configs(tmp_path: Path, monkeypatch) -> None:
     repo_root = tmp_path / "repo"
     repo_root.mkdir(parents=True, exist_ok=True)
-    _write_persona_policy(
-        repo_root / "persona" / "persona_policy.yaml",
-        "version: 1\npersona: roonie\nsenses:\n  enabled: false\n",
-    )
+    _write_persona_policy(repo_root / "persona" / "persona_policy.yaml")
 
-    monkeypatch.delenv("ROONIE_DASHBOARD_DATA_DIR", raising=False)
-    monkeypatch.delenv("ROONIE_DASHBOARD_LOGS_DIR", raising=False)
-    monkeypatch.delenv("ROONIE_DASHBOARD_RUNS_DIR", raising=False)
-    monkeypatch.delenv("ROONIE_PROVIDERS_CONFIG_PATH", raising=False)
-    monkeypatch.delenv("ROONIE_ROUTING_CONFIG_PATH", raising=False)
     monkeypatch.setenv("LOCALAPPDATA", str(tmp_path / "localapp"))
 
     paths = resolve_runtime_paths(repo_root=repo_root, runs_dir="runs", log_dir="logs")
@@ -112,26 +210,23 @@ def test_preflight_passes_and_seeds_configs(tmp_path: Path, monkeypatch) -> None
 
     assert result["ready"] is True
     assert result["blocking_reasons"] == []
-    assert (paths.data_dir / "providers_config.json").exists()
-    assert (paths.data_dir / "routing_config.json").exists()
-    assert (paths.data_dir / "senses_config.json").exists()
-    assert (paths.data_dir / "studio_profile.json").exists()
-    assert (paths.data_dir / "twitch_config.json").exists()
-    assert (paths.data_dir / "memory.sqlite").exists()
+    seeded = {
+        "providers_config.json",
+        "routing_config.json",
+        "senses_config.json",
+        "studio_profile.json",
+        "twitch_config.json",
+        "memory.sqlite",
+    }
+    assert seeded - set(os.listdir(paths.data_dir)) == set()
 
 
 def test_preflight_seeds_twitch_primary_channel_from_env(tmp_path: Path, monkeypatch) -> None:
     repo_root = tmp_path / "repo"
     repo_root.mkdir(parents=True, exist_ok=True)
-    _write_persona_policy(
-        repo_root / "persona" / "persona_policy.yaml",
-        "version: 1\npersona: roonie\nsenses:\n  enabled: false\n",
-    )
+    _write_persona_policy(repo_root / "persona" / "persona_policy.yaml")
     monkeypatch.setenv("LOCALAPPDATA", str(tmp_path / "localapp"))
     monkeypatch.setenv("TWITCH_CHANNEL", "RuleOfRune")
-    monkeypatch.delenv("ROONIE_DASHBOARD_DATA_DIR", raising=False)
-    monkeypatch.delenv("ROONIE_DASHBOARD_LOGS_DIR", raising=False)
-    monkeypatch.delenv("ROONIE_DASHBOARD_RUNS_DIR", raising=False)
 
     paths = resolve_runtime_paths(repo_root=repo_root, runs_dir="runs", log_dir="logs")
     result = run_preflight(paths)
@@ -144,14 +239,11 @@ def test_preflight_seeds_twitch_primary_channel_from_env(tmp_path: Path, monkeyp
 def test_preflight_fails_on_invalid_or_missing_persona_policy(tmp_path: Path, monkeypatch) -> None:
     repo_root = tmp_path / "repo"
     repo_root.mkdir(parents=True, exist_ok=True)
-    monkeypatch.delenv("ROONIE_DASHBOARD_DATA_DIR", raising=False)
-    monkeypatch.delenv("ROONIE_DASHBOARD_LOGS_DIR", raising=False)
-    monkeypatch.delenv("ROONIE_DASHBOARD_RUNS_DIR", raising=False)
     monkeypatch.setenv("LOCALAPPDATA", str(tmp_path / "localapp"))
 
     # invalid content
     policy_path = repo_root / "persona" / "persona_policy.yaml"
-    _write_persona_policy(policy_path, "this is not yaml")
+    _write_persona_policy(policy_path, b"this is not yaml")
     paths = resolve_runtime_paths(repo_root=repo_root, runs_dir="runs", log_dir="logs")
     result = run_preflight(paths)
     assert result["ready"] is False
@@ -165,26 +257,9 @@ def test_preflight_fails_on_invalid_or_missing_persona_policy(tmp_path: Path, mo
 
 
 
-def test_readiness_endpoint_returns_structure(tmp_path: Path, monkeypatch) -> None:
-    runs_dir = tmp_path / "runs"
-    runs_dir.mkdir(parents=True, exist_ok=True)
-    monkeypatch.setenv("ROONIE_DASHBOARD_DATA_DIR", str(tmp_path / "data"))
-    monkeypatch.setenv("ROONIE_DASHBOARD_LOGS_DIR", str(tmp_path / "logs"))
-    readiness_state = {
-        "ready": True,
-        "checked_at": "2026-02-13T00:00:00+00:00",
-        "items": [{"name": "preflight", "ok": True, "detail": "ok"}],
-        "blocking_reasons": [],
-    }
-
-    server, thread = _start_server(runs_dir, readiness_state)
-    try:
-        base = f"http://127.0.0.1:{server.server_address[1]}"
-        body = _get_json(base, "/api/system/readiness")
-    finally:
-        server.shutdown()
-        server.server_close()
-        thread.join(timeout=2.0)
+def test_readiness_endpoint_returns_structure(dashboard_server) -> None:
+    _, base = dashboard_server
+    body = _get_json(base, "/api/system/readiness")
 
     assert set(body.keys()) == {"ready", "checked_at", "items", "blocking_reasons"}
     assert body["ready"] is True
@@ -199,9 +274,6 @@ def test_runtime_path_resolver_prefers_localappdata_on_windows(tmp_path: Path, m
     repo_root.mkdir(parents=True, exist_ok=True)
     localapp = tmp_path / "localapp"
     monkeypatch.setenv("LOCALAPPDATA", str(localapp))
-    monkeypatch.delenv("ROONIE_DASHBOARD_DATA_DIR", raising=False)
-    monkeypatch.delenv("ROONIE_DASHBOARD_LOGS_DIR", raising=False)
-    monkeypatch.delenv("ROONIE_DASHBOARD_RUNS_DIR", raising=False)
 
     paths = resolve_runtime_paths(repo_root=repo_root, runs_dir="runs", log_dir="logs")
     expected_root = (localapp / "RoonieControlRoom").resolve()
@@ -214,9 +286,6 @@ def test_runtime_path_resolver_prefers_localappdata_on_windows(tmp_path: Path, m
 def test_runtime_path_resolver_defaults_to_repo_root_when_not_program_files(tmp_path: Path, monkeypatch) -> None:
     repo_root = tmp_path / "repo"
     repo_root.mkdir(parents=True, exist_ok=True)
-    monkeypatch.delenv("ROONIE_DASHBOARD_DATA_DIR", raising=False)
-    monkeypatch.delenv("ROONIE_DASHBOARD_LOGS_DIR", raising=False)
-    monkeypatch.delenv("ROONIE_DASHBOARD_RUNS_DIR", raising=False)
 
     paths = resolve_runtime_paths(repo_root=repo_root, runs_dir="runs", log_dir="logs")
     assert paths.runtime_root == repo_root.resolve()
@@ -279,97 +348,47 @@ def test_pin_setup_gate_launch_default_promotes_legacy_alias(monkeypatch) -> Non
     assert result == {"value": "0", "source": "legacy_alias"}
 
 
-def test_safe_start_defaults_force_disarmed_output_disabled(tmp_path: Path, monkeypatch) -> None:
-    runs_dir = tmp_path / "runs"
-    runs_dir.mkdir(parents=True, exist_ok=True)
-    data_dir = tmp_path / "data"
-    logs_dir = tmp_path / "logs"
-    monkeypatch.setenv("ROONIE_DASHBOARD_DATA_DIR", str(data_dir))
-    monkeypatch.setenv("ROONIE_DASHBOARD_LOGS_DIR", str(logs_dir))
-    monkeypatch.setenv("ROONIE_KILL_SWITCH", "0")
-    monkeypatch.setenv("ROONIE_ENFORCE_SETUP_GATE", "0")
+def test_safe_start_defaults_force_disarmed_output_disabled(dashboard_server) -> None:
+    server, base = dashboard_server
+    storage = getattr(server, "_roonie_storage")
+    assert isinstance(storage, DashboardStorage)
+    storage.set_armed(True)
+    storage.silence_now(ttl_seconds=120)
+    _apply_safe_start_defaults(storage)
 
-    readiness_state = {
-        "ready": True,
-        "checked_at": "2026-02-13T00:00:00+00:00",
-        "items": [{"name": "preflight", "ok": True, "detail": "ok"}],
-        "blocking_reasons": [],
-    }
-    server, thread = _start_server(runs_dir, readiness_state)
-    try:
-        storage = getattr(server, "_roonie_storage")
-        assert isinstance(storage, DashboardStorage)
-        storage.set_armed(True)
-        storage.silence_now(ttl_seconds=120)
-        _apply_safe_start_defaults(storage)
-
-        control_path = data_dir / "control_state.json"
-        assert control_path.exists()
-        payload = json.loads(control_path.read_text(encoding="utf-8"))
-        assert payload.get("armed") is False
-        assert payload.get("output_disabled") is True
-        assert payload.get("silence_until") is None
-
-        base = f"http://127.0.0.1:{server.server_address[1]}"
-        status = _get_json(base, "/api/status")
-    finally:
-        server.shutdown()
-        server.server_close()
-        thread.join(timeout=2.0)
+    control_path = storage.data_dir / "control_state.json"
+    assert control_path.exists()
+    payload = json.loads(control_path.read_text(encoding="utf-8"))
+    assert payload.get("armed") is False
+    assert payload.get("output_disabled") is True
+    assert payload.get("silence_until") is None
 
+    status = _get_json(base, "/api/status")
     assert status["armed"] is False
     assert status["can_post"] is False
 
 
-def test_twitch_output_enabled_tracks_active_state(tmp_path: Path, monkeypatch) -> None:
-    runs_dir = tmp_path / "runs"
-    runs_dir.mkdir(parents=True, exist_ok=True)
-    data_dir = tmp_path / "data"
-    logs_dir = tmp_path / "logs"
-    monkeypatch.setenv("ROONIE_DASHBOARD_DATA_DIR", str(data_dir))
-    monkeypatch.setenv("ROONIE_DASHBOARD_LOGS_DIR", str(logs_dir))
-    monkeypatch.setenv("ROONIE_KILL_SWITCH", "0")
-    monkeypatch.setenv("ROONIE_ENFORCE_SETUP_GATE", "0")
-
-    readiness_state = {
-        "ready": True,
-        "checked_at": "2026-02-13T00:00:00+00:00",
-        "items": [{"name": "preflight", "ok": True, "detail": "ok"}],
-        "blocking_reasons": [],
-    }
-    server, thread = _start_server(runs_dir, readiness_state)
-    try:
-        storage = getattr(server, "_roonie_storage")
-        assert isinstance(storage, DashboardStorage)
-        _apply_safe_start_defaults(storage)
-        assert os.getenv("TWITCH_OUTPUT_ENABLED") == "0"
-        state_armed = storage.set_armed(True)
-        assert state_armed["armed"] is True
-        assert os.getenv("TWITCH_OUTPUT_ENABLED") == "1"
-        state_disarmed = storage.set_armed(False)
-        assert state_disarmed["armed"] is False
-        assert os.getenv("TWITCH_OUTPUT_ENABLED") == "0"
-    finally:
-        server.shutdown()
-        server.server_close()
-        thread.join(timeout=2.0)
+def test_twitch_output_enabled_tracks_active_state(dashboard_server) -> None:
+    server, _ = dashboard_server
+    storage = getattr(server, "_roonie_storage")
+    assert isinstance(storage, DashboardStorage)
+    _apply_safe_start_defaults(storage)
+    assert os.getenv("TWITCH_OUTPUT_ENABLED") == "0"
+    state_armed = storage.set_armed(True)
+    assert state_armed["armed"] is True
+    assert os.getenv("TWITCH_OUTPUT_ENABLED") == "1"
+    state_disarmed = storage.set_armed(False)
+    assert state_disarmed["armed"] is False
+    assert os.getenv("TWITCH_OUTPUT_ENABLED") == "0"
 
 
 def test_run_control_room_refuses_start_when_port_already_in_use(tmp_path: Path, monkeypatch) -> None:
     repo_root = tmp_path / "repo"
     repo_root.mkdir(parents=True, exist_ok=True)
-    _write_persona_policy(
-        repo_root / "persona" / "persona_policy.yaml",
-        "version: 1\npersona: roonie\nsenses:\n  enabled: false\n",
-    )
+    _write_persona_policy(repo_root / "persona" / "persona_policy.yaml")
 
     monkeypatch.chdir(repo_root)
     monkeypatch.setenv("LOCALAPPDATA", str(tmp_path / "localapp"))
-    monkeypatch.delenv("ROONIE_DASHBOARD_DATA_DIR", raising=False)
-    monkeypatch.delenv("ROONIE_DASHBOARD_LOGS_DIR", raising=False)
-    monkeypatch.delenv("ROONIE_DASHBOARD_RUNS_DIR", raising=False)
-    monkeypatch.delenv("ROONIE_PROVIDERS_CONFIG_PATH", raising=False)
-    monkeypatch.delenv("ROONIE_ROUTING_CONFIG_PATH", raising=False)
 
     listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     listener.bind(("127.0.0.1", 0))
@@ -479,22 +498,49 @@ def test_load_secrets_env_force_keys_override_existing(tmp_path: Path, monkeypat
     assert os.getenv("OPENAI_MODEL") == "other-model"
 
 
+def test_load_secrets_env_keeps_hash_and_equals_in_values(tmp_path: Path, monkeypatch) -> None:
+    env_file = tmp_path / "secrets.env"
+    env_file.write_text(
+        "  # indented comment\r\n"
+        "\r\n"
+        "  TWITCH_OAUTH_TOKEN = oauth:abc#123==  \r\n"
+        "=orphan\r\n"
+        "no equals here\r\n"
+        'OPENAI_MODEL="gpt-5.2"',
+        encoding="utf-8",
+    )
+    monkeypatch.delenv("TWITCH_OAUTH_TOKEN", raising=False)
+    monkeypatch.delenv("OPENAI_MODEL", raising=False)
+
+    stats = _load_secrets_env_into_process(env_file, override_existing=False)
+
+    assert stats["loaded"] == 2
+    assert stats["ignored"] == 4
+    assert os.getenv("TWITCH_OAUTH_TOKEN") == "oauth:abc#123=="
+    assert os.getenv("OPENAI_MODEL") == "gpt-5.2"
+
+
+_BARE_LAUNCHER_RE = re.compile(rb"python(?:\.exe)?\s+-m\s+roonie\.run_control_room", re.IGNORECASE)
+_LAUNCHER_SCAN_SUFFIXES = (".py", ".ps1", ".bat", ".cmd")
+
+
+def _iter_launcher_scan_files(root: str):
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file() and entry.name.lower().endswith(_LAUNCHER_SCAN_SUFFIXES):
+                    yield entry.path
+
+
 def test_no_bare_python_run_control_room_spawn_in_source() -> None:
     root = Path(__file__).resolve().parents[1]
-    scan_roots = [root / "src", root / "scripts"]
-    banned = (
-        "python -m roonie.run_control_room",
-        "python.exe -m roonie.run_control_room",
-    )
-    for scan_root in scan_roots:
-        if not scan_root.exists():
+    for scan_root in (root / "src", root / "scripts"):
+        if not scan_root.is_dir():
             continue
-        for path in scan_root.rglob("*"):
-            if not path.is_file():
-                continue
-            if path.suffix.lower() not in {".py", ".ps1", ".bat", ".cmd"}:
-                continue
-            text = path.read_text(encoding="utf-8-sig")
-            lowered = text.lower()
-            for needle in banned:
-                assert needle not in lowered, f"Found bare python launcher in {path}: {needle}"
+        for path in _iter_launcher_scan_files(str(scan_root)):
+            with open(path, "rb") as fh:
+                match = _BARE_LAUNCHER_RE.search(fh.read())
+            assert match is None, f"Found bare python launcher in {path}: {match.group(0).decode('latin-1')}"
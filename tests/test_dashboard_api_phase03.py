@@ -806,7 +806,8 @@ def test_login_rate_limit_success_resets_counter(tmp_path: Path, monkeypatch) ->
     assert locked_body["error"] == "rate_limited"
 
 
-def test_login_rate_limit_expires_after_lockout_ttl(tmp_path: Path, monkeypatch) -> None:
+def test_login_rate_limit_expires_after_lockout_ttl(tmp_path: Path, monkeypatch, fast_pbkdf2) -> None:
+    # Three production-cost hashes can outlast the 0.1 s lockout before the locked attempt.
     runs_dir = tmp_path / "runs"
     _write_sample_run(runs_dir)
     _set_dashboard_paths(monkeypatch, tmp_path)
@@ -31,12 +31,8 @@ def _make_payload(*, active_director: str, message: str) -> Dict[str, Any]:
 
 
 @pytest.fixture(autouse=True)
-def _reset_output_gate_globals(monkeypatch):
-    # output_gate uses module-level rate limit globals; reset for deterministic tests.
-    import responders.output_gate as og
-
-    og._LAST_EMIT_TS = 0.0
-    og._LAST_EMIT_BY_KEY = {}
+def _reset_output_gate_env(monkeypatch):
+    # Emit-state globals are reset by conftest; only the gate env is module-specific.
     monkeypatch.delenv("ROONIE_READ_ONLY_MODE", raising=False)
     monkeypatch.delenv("ROONIE_DRY_RUN", raising=False)
     monkeypatch.setenv("ROONIE_OUTPUT_DISABLED", "0")
@@ -8,11 +8,20 @@ from pathlib import Path
 from typing import Any, Dict, List, Tuple
 from urllib.parse import urlparse
 
+import pytest
+
 from live_shim.record_run import run_payload
 from roonie.dashboard_api.app import create_server
 from roonie.types import DecisionRecord, Env, Event
 
 
+@pytest.fixture(autouse=True)
+def _open_output_gate(monkeypatch):
+    # Emit-state reset happens in conftest; every test here needs the gate open and unthrottled.
+    monkeypatch.setenv("ROONIE_OUTPUT_DISABLED", "0")
+    monkeypatch.setenv("ROONIE_OUTPUT_RATE_LIMIT_SECONDS", "0")
+
+
 def _set_runtime_paths(monkeypatch, tmp_path: Path) -> Path:
     runs_dir = tmp_path / "runs"
     monkeypatch.setenv("ROONIE_DASHBOARD_RUNS_DIR", str(runs_dir))
@@ -137,13 +146,7 @@ def _with_auto_cookie(base: str, path: str) -> Dict[str, str]:
 
 
 def test_approved_emote_allow_list_enforced_and_logged(tmp_path, monkeypatch) -> None:
-    import responders.output_gate as output_gate
-
     runs_dir = _set_runtime_paths(monkeypatch, tmp_path)
-    monkeypatch.setenv("ROONIE_OUTPUT_DISABLED", "0")
-    monkeypatch.setenv("ROONIE_OUTPUT_RATE_LIMIT_SECONDS", "0")
-    output_gate._LAST_EMIT_TS = 0.0
-    output_gate._LAST_EMIT_BY_KEY.clear()
 
     send_calls: List[Dict[str, Any]] = []
 
@@ -196,13 +199,7 @@ def test_approved_emote_allow_list_enforced_and_logged(tmp_path, monkeypatch) ->
 
 
 def test_ruleof6_emote_with_description_format_is_enforced(tmp_path, monkeypatch) -> None:
-    import responders.output_gate as output_gate
-
     _ = _set_runtime_paths(monkeypatch, tmp_path)
-    monkeypatch.setenv("ROONIE_OUTPUT_DISABLED", "0")
-    monkeypatch.setenv("ROONIE_OUTPUT_RATE_LIMIT_SECONDS", "0")
-    output_gate._LAST_EMIT_TS = 0.0
-    output_gate._LAST_EMIT_BY_KEY.clear()
 
     send_calls: List[Dict[str, Any]] = []
 
@@ -243,13 +240,7 @@ def test_ruleof6_emote_with_description_format_is_enforced(tmp_path, monkeypatch
 
 
 def test_mention_username_with_digit_does_not_trigger_disallowed_emote(tmp_path, monkeypatch) -> None:
-    import responders.output_gate as output_gate
-
     _ = _set_runtime_paths(monkeypatch, tmp_path)
-    monkeypatch.setenv("ROONIE_OUTPUT_DISABLED", "0")
-    monkeypatch.setenv("ROONIE_OUTPUT_RATE_LIMIT_SECONDS", "0")
-    output_gate._LAST_EMIT_TS = 0.0
-    output_gate._LAST_EMIT_BY_KEY.clear()
 
     send_calls: List[Dict[str, Any]] = []
 
@@ -276,13 +267,7 @@ def test_mention_username_with_digit_does_not_trigger_disallowed_emote(tmp_path,
 
 
 def test_pascal_case_proper_noun_mid_sentence_does_not_trigger_disallowed_emote(tmp_path, monkeypatch) -> None:
-    import responders.output_gate as output_gate
-
     _ = _set_runtime_paths(monkeypatch, tmp_path)
-    monkeypatch.setenv("ROONIE_OUTPUT_DISABLED", "0")
-    monkeypatch.setenv("ROONIE_OUTPUT_RATE_LIMIT_SECONDS", "0")
-    output_gate._LAST_EMIT_TS = 0.0
-    output_gate._LAST_EMIT_BY_KEY.clear()
 
     send_calls: List[Dict[str, Any]] = []
 
@@ -313,13 +298,7 @@ def test_pascal_case_proper_noun_mid_sentence_does_not_trigger_disallowed_emote(
 
 
 def test_time_tokens_with_allowed_emote_do_not_trigger_disallowed_emote(tmp_path, monkeypatch) -> None:
-    import responders.output_gate as output_gate
-
     _ = _set_runtime_paths(monkeypatch, tmp_path)
-    monkeypatch.setenv("ROONIE_OUTPUT_DISABLED", "0")
-    monkeypatch.setenv("ROONIE_OUTPUT_RATE_LIMIT_SECONDS", "0")
-    output_gate._LAST_EMIT_TS = 0.0
-    output_gate._LAST_EMIT_BY_KEY.clear()
 
     send_calls: List[Dict[str, Any]] = []
 
@@ -362,13 +341,7 @@ def test_time_tokens_with_allowed_emote_do_not_trigger_disallowed_emote(tmp_path
 
 
 def test_echoed_disallowed_emote_token_from_viewer_message_is_allowed(tmp_path, monkeypatch) -> None:
-    import responders.output_gate as output_gate
-
     _ = _set_runtime_paths(monkeypatch, tmp_path)
-    monkeypatch.setenv("ROONIE_OUTPUT_DISABLED", "0")
-    monkeypatch.setenv("ROONIE_OUTPUT_RATE_LIMIT_SECONDS", "0")
-    output_gate._LAST_EMIT_TS = 0.0
-    output_gate._LAST_EMIT_BY_KEY.clear()
 
     send_calls: List[Dict[str, Any]] = []
 
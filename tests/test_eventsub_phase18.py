@@ -152,6 +152,39 @@ def test_eventsub_subscriptions_include_phase1_types(monkeypatch) -> None:
     assert "stream.online" in posted_types
 
 
+def test_eventsub_subscriptions_skip_recently_subscribed_session(monkeypatch) -> None:
+    posted: List[str] = []
+    clock = [1000.0]
+    client = EventSubWSClient(
+        oauth_token="oauth:testtoken",
+        client_id="cid",
+        broadcaster_user_id="1234",
+        on_event=lambda _event: None,
+        ws_factory=lambda _url: None,
+        time_fn=lambda: clock[0],
+    )
+
+    def _post_subscription(*, session_id: str, sub_type: str, version: str, condition: Dict[str, Any]) -> None:
+        _ = (sub_type, version, condition)
+        posted.append(session_id)
+
+    monkeypatch.setattr(client, "_post_subscription", _post_subscription)
+    client._ensure_subscriptions("session-1")
+    per_session = len(posted)
+    assert per_session > 0
+
+    clock[0] += 30.0
+    client._ensure_subscriptions("session-1")
+    assert len(posted) == per_session
+
+    client._ensure_subscriptions("session-2")
+    assert len(posted) == 2 * per_session
+
+    clock[0] += 600.0
+    client._ensure_subscriptions("session-1")
+    assert len(posted) == 3 * per_session
+
+
 def test_eventsub_dedupe_by_twitch_event_id() -> None:
     seen: List[Dict[str, Any]] = []
     client = EventSubWSClient(
@@ -3,7 +3,7 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
-from live_shim.record_run import run_payload
+from live_shim.record_run import build_run_doc, run_payload
 from roonie.offline_director import OfflineDirector
 from roonie.provider_director import ProviderDirector
 from roonie.types import Env, Event
@@ -239,8 +239,7 @@ def test_live_payload_defaults_to_provider_director(tmp_path, monkeypatch) -> No
             }
         ],
     }
-    out_path = run_payload(payload, emit_outputs=False)
-    run_doc = json.loads(out_path.read_text(encoding="utf-8"))
+    run_doc = build_run_doc(payload, emit_outputs=False)
     assert run_doc["active_director"] == "ProviderDirector"
     decision = run_doc["decisions"][0]
     assert decision["trace"]["director"]["type"] == "ProviderDirector"
@@ -320,11 +319,6 @@ def test_live_payload_suppressed_output_does_not_add_assistant_context(tmp_path,
     monkeypatch.setenv("ROONIE_ROUTING_CONFIG_PATH", str(tmp_path / "routing_config.json"))
     monkeypatch.setenv("ROONIE_OUTPUT_RATE_LIMIT_SECONDS", "0")
 
-    import responders.output_gate as output_gate
-
-    output_gate._LAST_EMIT_TS = 0.0
-    output_gate._LAST_EMIT_BY_KEY.clear()
-
     captured_prompts = []
 
     def _stub_route_generate(**kwargs):
@@ -402,11 +396,6 @@ def test_live_payload_emitted_output_can_add_assistant_context(tmp_path, monkeyp
     monkeypatch.setenv("ROONIE_OUTPUT_DISABLED", "0")
     monkeypatch.setenv("ROONIE_OUTPUT_RATE_LIMIT_SECONDS", "0")
 
-    import responders.output_gate as output_gate
-
-    output_gate._LAST_EMIT_TS = 0.0
-    output_gate._LAST_EMIT_BY_KEY.clear()
-
     captured_prompts = []
 
     def _stub_route_generate(**kwargs):
@@ -492,8 +481,7 @@ def test_live_payload_honors_manual_offline_director_override(tmp_path, monkeypa
             }
         ],
     }
-    out_path = run_payload(payload, emit_outputs=False)
-    run_doc = json.loads(out_path.read_text(encoding="utf-8"))
+    run_doc = build_run_doc(payload, emit_outputs=False)
     assert run_doc["active_director"] == "OfflineDirector"
     decision = run_doc["decisions"][0]
     assert decision["route"] == "responder:neutral_ack"
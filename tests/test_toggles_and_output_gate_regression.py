@@ -389,7 +389,6 @@ def test_output_gate_armed_rate_limit_and_cost_cap_still_gate_posts(tmp_path, mo
     monkeypatch.setenv("ROONIE_ROUTING_CONFIG_PATH", str(routing_path))
     monkeypatch.setenv("ROONIE_OUTPUT_DISABLED", "0")
     monkeypatch.setenv("ROONIE_OUTPUT_RATE_LIMIT_SECONDS", "999")
-    output_gate._LAST_EMIT_TS = 0.0
     _write_provider_config(providers_path, active_provider="openai")
     _write_routing_config(routing_path, enabled=True)
 